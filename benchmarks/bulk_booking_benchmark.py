@@ -0,0 +1,77 @@
+import random
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from reservation_system.errors import (
+    CourtIsClosed,
+    SlotUnavailable,
+    TooManyReservations,
+)
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+BATCH_SIZES = [1_000, 10_000, 50_000]
+COURTS = 8
+DAYS = 365
+USERS = 20_000
+
+
+def generate_league_bookings(count: int, first_day: datetime) -> list[Reservation]:
+    generator = random.Random(count)
+    bookings = []
+    for _ in range(count):
+        start_date = first_day + timedelta(
+            days=generator.randrange(DAYS), minutes=30 * generator.randrange(20)
+        )
+        bookings.append(
+            Reservation(
+                f"Player {generator.randrange(USERS)}",
+                start_date,
+                start_date + timedelta(minutes=generator.choice([30, 60, 90])),
+                generator.randrange(1, COURTS + 1),
+            )
+        )
+    return bookings
+
+
+def book_one_by_one(manager: ReservationManager, bookings: list[Reservation]) -> int:
+    booked = 0
+    for booking in bookings:
+        try:
+            manager.make_a_reservation(
+                booking.full_name,
+                booking.start_date,
+                (booking.end_date - booking.start_date) // timedelta(minutes=1),
+                booking.court,
+            )
+            booked += 1
+        except (CourtIsClosed, SlotUnavailable, TooManyReservations):
+            pass
+    return booked
+
+
+def run() -> None:
+    first_day = (datetime.today() + timedelta(days=2)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    print(f"{'bookings':>9} {'one by one s':>13} {'bulk s':>8} {'booked':>13}")
+    for batch_size in BATCH_SIZES:
+        bookings = generate_league_bookings(batch_size, first_day)
+        manager = ReservationManager(courts=range(1, COURTS + 1))
+        started = perf_counter()
+        booked_one_by_one = book_one_by_one(manager, bookings)
+        one_by_one_seconds = perf_counter() - started
+
+        manager = ReservationManager(courts=range(1, COURTS + 1))
+        started = perf_counter()
+        results = manager.make_reservations_bulk(bookings)
+        bulk_seconds = perf_counter() - started
+        booked_in_bulk = sum(1 for result in results if result.applied)
+        print(
+            f"{batch_size:>9} {one_by_one_seconds:>13.3f} {bulk_seconds:>8.3f} "
+            f"{booked_one_by_one:>6}/{booked_in_bulk:<6}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,107 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from benchmarks.schedule_generator import generate_schedule
+from reservation_system.configuration import JOURNAL_FILE, SNAPSHOT_FILE
+from reservation_system.datetime_utils import format_datetime
+from reservation_system.reservation_manager import ReservationManager
+
+RUNS = 20
+USERS = 200
+DAYS = 28
+FILL_RATE = 0.5
+FIRST_DAY = datetime(2030, 1, 7)
+FIRST_BOOKING = FIRST_DAY + timedelta(days=DAYS + 7, hours=10)
+WATCHED_MODULES = [
+    "csv",
+    "calendar",
+    "_strptime",
+    "concurrent.futures",
+    "reservation_system.reservation_csv_serializer",
+    "reservation_system.reservation_json_serializer",
+    "reservation_system.user_interface",
+]
+
+
+def command_line(*arguments: str) -> list[str]:
+    return [sys.executable, "-m", "reservation_system.main", *arguments]
+
+
+def commands(run: int) -> list[tuple[str, list[str]]]:
+    booking = format_datetime(FIRST_BOOKING + timedelta(days=run))
+    week_start = format_datetime(FIRST_DAY)
+    week_end = format_datetime(FIRST_DAY + timedelta(days=7))
+    return [
+        ("python -c pass", [sys.executable, "-c", "pass"]),
+        (
+            "import main",
+            [sys.executable, "-c", "import reservation_system.main"],
+        ),
+        ("book", command_line("book", f"Startup User {run}", booking, "60")),
+        ("cancel", command_line("cancel", f"Startup User {run}", booking)),
+        ("schedule", command_line("schedule", week_start, week_end)),
+        ("export csv", command_line("export", week_start, week_end, "week.csv")),
+        ("import csv", command_line("import", "week.csv", "--merge")),
+    ]
+
+
+def imported_modules(
+    command: list[str], directory: str, environment: dict[str, str]
+) -> list[str]:
+    finished = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]],
+        cwd=directory,
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+    loaded = {line.rsplit("|", 1)[-1].strip() for line in finished.stderr.splitlines()}
+    return [module for module in WATCHED_MODULES if module in loaded]
+
+
+def run() -> None:
+    repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=repository)
+    with tempfile.TemporaryDirectory() as directory:
+        manager = ReservationManager()
+        manager.open_journal(
+            os.path.join(directory, JOURNAL_FILE),
+            os.path.join(directory, SNAPSHOT_FILE),
+        )
+        manager.replace_reservations(
+            generate_schedule(USERS, DAYS, FILL_RATE, first_day=FIRST_DAY)
+        )
+        manager.close()
+        print(
+            f"{sum(map(len, manager.court_reservations.values()))} reservations in the snapshot"
+        )
+
+        timings: dict[str, list[float]] = {}
+        for run in range(RUNS):
+            for name, command in commands(run):
+                started = perf_counter()
+                subprocess.run(
+                    command,
+                    cwd=directory,
+                    env=environment,
+                    stdout=subprocess.DEVNULL,
+                    check=True,
+                )
+                timings.setdefault(name, []).append(perf_counter() - started)
+
+        print(f"{'command':<16} {'median ms':>10} {'min ms':>8}  heavy modules")
+        for name, command in commands(RUNS):
+            modules = imported_modules(command, directory, environment)
+            print(
+                f"{name:<16} {statistics.median(timings[name]) * 1000:>10.1f} "
+                f"{min(timings[name]) * 1000:>8.1f}  {', '.join(modules) or '-'}"
+            )
+
+
+if __name__ == "__main__":
+    run()
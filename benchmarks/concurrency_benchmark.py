@@ -0,0 +1,96 @@
+import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from reservation_system.configuration import MAX_RESERVATIONS_PER_WEEK
+from reservation_system.errors import SlotUnavailable, TooManyReservations
+from reservation_system.reservation_manager import ReservationManager
+
+THREAD_COUNTS = [1, 2, 4, 8, 16]
+ATTEMPTS = 40_000
+COURTS = 4
+DAYS = 60
+USERS = 5_000
+
+
+def book_random_slots(
+    manager: ReservationManager, first_day: datetime, attempts: int, seed: int
+) -> int:
+    generator = random.Random(seed)
+    booked = 0
+    for _ in range(attempts):
+        start_date = first_day + timedelta(
+            days=generator.randrange(DAYS), minutes=30 * generator.randrange(18)
+        )
+        try:
+            manager.make_a_reservation(
+                f"Player {generator.randrange(USERS)}",
+                start_date,
+                generator.choice([30, 60]),
+                generator.randrange(1, COURTS + 1),
+            )
+            booked += 1
+        except (SlotUnavailable, TooManyReservations):
+            pass
+    return booked
+
+
+def count_overlaps(manager: ReservationManager, first_day: datetime) -> int:
+    overlaps = 0
+    for court in manager.courts:
+        reservations = manager.find_reservation_in_range(
+            first_day, first_day + timedelta(days=DAYS), court
+        )
+        for previous, current in zip(reservations, reservations[1:]):
+            if current.start_date < previous.end_date:
+                overlaps += 1
+    return overlaps
+
+
+def count_weekly_limit_breaches(
+    manager: ReservationManager, first_day: datetime
+) -> int:
+    bookings_per_week = Counter(
+        manager.week_key(reservation.full_name, reservation.start_date)
+        for reservation in manager.find_reservation_in_range(
+            first_day, first_day + timedelta(days=DAYS)
+        )
+    )
+    return sum(
+        1 for count in bookings_per_week.values() if count > MAX_RESERVATIONS_PER_WEEK
+    )
+
+
+def run() -> None:
+    first_day = (datetime.today() + timedelta(days=2)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    print(
+        f"{'threads':>7} {'bookings/s':>11} {'attempts/s':>11} "
+        f"{'overlaps':>9} {'limit breaches':>15}"
+    )
+    for thread_count in THREAD_COUNTS:
+        manager = ReservationManager(courts=range(1, COURTS + 1))
+        attempts_per_thread = ATTEMPTS // thread_count
+        started = perf_counter()
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            booked = sum(
+                executor.map(
+                    lambda seed: book_random_slots(
+                        manager, first_day, attempts_per_thread, seed
+                    ),
+                    range(thread_count),
+                )
+            )
+        seconds = perf_counter() - started
+        print(
+            f"{thread_count:>7} {booked / seconds:>11.0f} "
+            f"{ATTEMPTS / seconds:>11.0f} {count_overlaps(manager, first_day):>9} "
+            f"{count_weekly_limit_breaches(manager, first_day):>15}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Callable, Optional, Sequence
+
+from benchmarks.schedule_generator import generate_schedule
+from reservation_system.const import FileType
+from reservation_system.errors import (
+    CourtIsClosed,
+    ReservationNoExist,
+    SlotUnavailable,
+    TooManyReservations,
+)
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+SCALES = {
+    "small": (1_000, 30, 4, 0.6),
+    "medium": (10_000, 365, 4, 0.6),
+    "large": (50_000, 730, 16, 0.7),
+}
+OPERATIONS = 2_000
+FILE_REPEATS = 3
+FIRST_DAY = datetime(2030, 1, 7)
+FILE_TYPES = [FileType.CSV, FileType.JSON, FileType.BINARY]
+
+Result = dict[str, Any]
+
+
+def measure(call: Callable[[Any], Any], arguments: Sequence[Any]) -> Result:
+    started = perf_counter()
+    for argument in arguments:
+        call(argument)
+    seconds = perf_counter() - started
+    return {
+        "count": len(arguments),
+        "seconds": seconds,
+        "per_operation_us": seconds / len(arguments) * 1_000_000,
+    }
+
+
+def random_start_dates(
+    generator: random.Random, days: int, count: int
+) -> list[datetime]:
+    return [
+        FIRST_DAY
+        + timedelta(days=generator.randrange(days), hours=8, minutes=30 * slot)
+        for slot in (generator.randrange(18) for _ in range(count))
+    ]
+
+
+def benchmark_scale(
+    users: int, days: int, courts: int, fill_rate: float, directory: str
+) -> Result:
+    generator = random.Random(days)
+    schedule = generate_schedule(users, days, fill_rate, courts, FIRST_DAY)
+    manager = ReservationManager(courts=range(1, courts + 1))
+    manager.replace_reservations(schedule)
+    last_day = FIRST_DAY + timedelta(days=days)
+    operations: Result = {}
+
+    def book(booking: tuple[int, datetime, int]) -> None:
+        number, start_date, court = booking
+        try:
+            manager.make_a_reservation(f"Guest {number}", start_date, 60, court)
+        except (CourtIsClosed, SlotUnavailable, TooManyReservations):
+            pass
+
+    operations["booking"] = measure(
+        book,
+        [
+            (number, start_date, generator.randrange(1, courts + 1))
+            for number, start_date in enumerate(
+                random_start_dates(generator, days, OPERATIONS)
+            )
+        ],
+    )
+
+    def cancel(reservation: Reservation) -> None:
+        try:
+            manager.delete_a_reservation(
+                reservation.full_name, reservation.start_date, reservation.court
+            )
+        except ReservationNoExist:
+            pass
+
+    operations["cancellation"] = measure(
+        cancel, generator.sample(schedule, min(OPERATIONS, len(schedule)))
+    )
+    operations["range_query"] = measure(
+        lambda day: manager.find_reservation_in_range(day, day + timedelta(days=1)),
+        [
+            FIRST_DAY + timedelta(days=generator.randrange(days))
+            for _ in range(OPERATIONS)
+        ],
+    )
+
+    def nearest(search: tuple[datetime, int]) -> None:
+        try:
+            manager.find_nearest_available_slot(search[0], 60, search[1])
+        except SlotUnavailable:
+            pass
+
+    operations["nearest_slot"] = measure(
+        nearest,
+        [
+            (start_date, generator.randrange(1, courts + 1))
+            for start_date in random_start_dates(generator, days, OPERATIONS)
+        ],
+    )
+
+    for file_type in FILE_TYPES:
+        name_of_file = os.path.join(directory, f"schedule.{file_type.lower()}")
+        operations[f"save_{file_type.lower()}"] = measure(
+            lambda _: manager.save_reservations_from_range(
+                FIRST_DAY, last_day, name_of_file, file_type
+            ),
+            [None] * FILE_REPEATS,
+        )
+        loading_manager = ReservationManager(courts=range(1, courts + 1))
+        operations[f"load_{file_type.lower()}"] = measure(
+            lambda _: loading_manager.load_reservations_from_file(
+                name_of_file, file_type
+            ),
+            [None] * FILE_REPEATS,
+        )
+    return {
+        "users": users,
+        "days": days,
+        "courts": courts,
+        "fill_rate": fill_rate,
+        "reservations": len(schedule),
+        "operations": operations,
+    }
+
+
+def revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: Result, baseline: Optional[Result]) -> None:
+    header = f"{'scale':<8} {'operation':<14} {'count':>6} {'us/op':>12}"
+    if baseline is not None:
+        header += f" {'baseline':>12} {'change':>8}"
+    print(header)
+    for scale, scale_results in results["scales"].items():
+        baseline_operations = (
+            baseline["scales"].get(scale, {}).get("operations", {})
+            if baseline is not None
+            else {}
+        )
+        for operation, result in scale_results["operations"].items():
+            line = (
+                f"{scale:<8} {operation:<14} {result['count']:>6} "
+                f"{result['per_operation_us']:>12.1f}"
+            )
+            baseline_result = baseline_operations.get(operation)
+            if baseline_result is not None:
+                baseline_us = baseline_result["per_operation_us"]
+                change = (result["per_operation_us"] / baseline_us - 1) * 100
+                line += f" {baseline_us:>12.1f} {change:>+7.1f}%"
+            print(line)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the core reservation operations on generated schedules."
+    )
+    parser.add_argument(
+        "--scale", action="append", choices=list(SCALES), help="default: all scales"
+    )
+    parser.add_argument("--output", help="save the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with results saved earlier")
+    arguments = parser.parse_args()
+
+    baseline = None
+    if arguments.baseline:
+        with open(arguments.baseline, encoding="utf8") as baseline_file:
+            baseline = json.load(baseline_file)
+    results: Result = {
+        "revision": revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "operations_per_scale": OPERATIONS,
+        "scales": {},
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in arguments.scale or list(SCALES):
+            results["scales"][scale] = benchmark_scale(*SCALES[scale], directory)
+    print_results(results, baseline)
+    if arguments.output:
+        with open(arguments.output, mode="w", encoding="utf8") as output_file:
+            json.dump(results, output_file, indent=3)
+
+
+if __name__ == "__main__":
+    run()
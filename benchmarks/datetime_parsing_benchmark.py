@@ -0,0 +1,47 @@
+import random
+from datetime import datetime, timedelta
+from timeit import timeit
+
+from reservation_system.configuration import DATETIME_FORMAT
+from reservation_system.datetime_utils import format_datetime, parse_datetime
+
+ROWS = 1_000_000
+
+
+def generate_rows(count: int) -> list[str]:
+    first_day = datetime(2020, 1, 1, 8, 0)
+    return [
+        format_datetime(
+            first_day
+            + timedelta(
+                days=random.randrange(3 * 365), minutes=30 * random.randrange(20)
+            )
+        )
+        for _ in range(count)
+    ]
+
+
+def run() -> None:
+    rows = generate_rows(ROWS)
+    dates = [parse_datetime(row) for row in rows]
+    results = {
+        "strptime": timeit(
+            lambda: [datetime.strptime(row, DATETIME_FORMAT) for row in rows], number=1
+        ),
+        "parse_datetime": timeit(
+            lambda: [parse_datetime(row) for row in rows], number=1
+        ),
+        "strftime": timeit(
+            lambda: [date.strftime(DATETIME_FORMAT) for date in dates], number=1
+        ),
+        "format_datetime": timeit(
+            lambda: [format_datetime(date) for date in dates], number=1
+        ),
+    }
+    print(f"{ROWS} rows")
+    for name, seconds in results.items():
+        print(f"{name:>16}: {seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    run()
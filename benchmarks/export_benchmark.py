@@ -0,0 +1,65 @@
+import os
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from reservation_system.const import FileType
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+COURTS = 16
+DAYS = 365
+EXPORTS = [
+    (FileType.CSV, "schedule.csv", False),
+    (FileType.CSV, "schedule.csv.gz", False),
+    (FileType.JSON, "schedule.json", False),
+    (FileType.JSON, "schedule.json.gz", False),
+    (FileType.JSON, "compact.json", True),
+    (FileType.JSON, "compact.json.gz", True),
+]
+
+
+def year_of_history(first_day: datetime) -> list[Reservation]:
+    return [
+        Reservation(
+            f"Player {court}-{day % 50}-{slot}",
+            first_day + timedelta(days=day, minutes=30 * slot),
+            first_day + timedelta(days=day, minutes=30 * (slot + 1)),
+            court,
+        )
+        for day in range(DAYS)
+        for court in range(1, COURTS + 1)
+        for slot in range(20)
+    ]
+
+
+def run() -> None:
+    first_day = datetime(2030, 1, 1, 8, 0)
+    last_day = first_day + timedelta(days=DAYS)
+    manager = ReservationManager(courts=range(1, COURTS + 1))
+    manager.replace_reservations(year_of_history(first_day))
+    print(f"{COURTS * DAYS * 20} reservations")
+    print(f"{'file':>17} {'seconds':>8} {'size [MB]':>10} {'peak memory [MB]':>17}")
+    with tempfile.TemporaryDirectory() as directory:
+        for file_type, file_name, compact in EXPORTS:
+            name_of_file = os.path.join(directory, file_name)
+            started = perf_counter()
+            manager.save_reservations_from_range(
+                first_day, last_day, name_of_file, file_type, compact
+            )
+            seconds = perf_counter() - started
+            tracemalloc.start()
+            manager.save_reservations_from_range(
+                first_day, last_day, name_of_file, file_type, compact
+            )
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{file_name:>17} {seconds:>8.2f} "
+                f"{os.path.getsize(name_of_file) / 2**20:>10.1f} {peak / 2**20:>17.2f}"
+            )
+
+
+if __name__ == "__main__":
+    run()
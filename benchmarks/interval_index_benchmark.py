@@ -0,0 +1,64 @@
+import random
+from datetime import datetime, timedelta
+from timeit import timeit
+
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_index import ReservationIndex
+
+SIZES = [10_000, 100_000, 1_000_000]
+QUERIES = 200
+
+
+def generate_reservations(count: int) -> list[Reservation]:
+    reservations = []
+    day = datetime(2020, 1, 1, 8, 0)
+    start_date = day
+    for number in range(count):
+        end_date = start_date + timedelta(minutes=random.choice([30, 60, 90]))
+        if end_date > day.replace(hour=18):
+            day += timedelta(days=1)
+            start_date = day
+            end_date = start_date + timedelta(minutes=60)
+        reservations.append(Reservation(f"Player {number % 500}", start_date, end_date))
+        start_date = end_date + timedelta(minutes=random.choice([0, 30]))
+    return reservations
+
+
+def linear_overlapping(
+    reservations: list[Reservation], start_date: datetime, end_date: datetime
+) -> list[Reservation]:
+    return [
+        reservation
+        for reservation in reservations
+        if reservation.start_date < end_date and reservation.end_date > start_date
+    ]
+
+
+def run() -> None:
+    print(
+        f"{'reservations':>12} {'list scan [ms]':>15} {'index [ms]':>11} {'speedup':>8}"
+    )
+    for size in SIZES:
+        reservations = generate_reservations(size)
+        index = ReservationIndex(reservations)
+        first_day = reservations[0].start_date
+        span = reservations[-1].start_date - first_day
+        queries = [first_day + span * random.random() for _ in range(QUERIES)]
+        windows = [(query, query + timedelta(hours=2)) for query in queries]
+
+        list_seconds = timeit(
+            lambda: [linear_overlapping(reservations, *window) for window in windows],
+            number=1,
+        )
+        index_seconds = timeit(
+            lambda: [index.overlapping(*window) for window in windows], number=1
+        )
+        print(
+            f"{size:>12} {list_seconds / QUERIES * 1000:>15.3f} "
+            f"{index_seconds / QUERIES * 1000:>11.4f} "
+            f"{list_seconds / index_seconds:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    run()
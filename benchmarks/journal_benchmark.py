@@ -0,0 +1,50 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from timeit import timeit
+
+from benchmarks.interval_index_benchmark import generate_reservations
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_binary_serializer import (
+    ReservationBinarySerializer,
+)
+from reservation_system.reservation_journal import ReservationJournal
+
+ROWS = 100_000
+BOOKINGS = 1_000
+
+
+def record_bookings(journal: ReservationJournal, bookings: list[Reservation]) -> None:
+    for booking in bookings:
+        journal.record_make(booking)
+
+
+def run() -> None:
+    reservations = generate_reservations(ROWS)
+    first_day = datetime(2040, 1, 2, 8, 0)
+    bookings = [
+        Reservation(
+            f"Player {number}",
+            first_day + timedelta(days=number),
+            first_day + timedelta(days=number, hours=1),
+        )
+        for number in range(BOOKINGS)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        journal = ReservationJournal(os.path.join(directory, "schedule.journal"))
+        journal_seconds = timeit(lambda: record_bookings(journal, bookings), number=1)
+        journal.close()
+
+        serializer = ReservationBinarySerializer(
+            os.path.join(directory, "schedule.snapshot")
+        )
+        rewrite_seconds = timeit(
+            lambda: serializer.save_reservations(reservations), number=10
+        )
+    print(f"{ROWS} reservations in the schedule")
+    print(f"journal append: {journal_seconds / BOOKINGS * 1000:.3f} ms/booking")
+    print(f"full snapshot rewrite: {rewrite_seconds / 10 * 1000:.3f} ms/booking")
+
+
+if __name__ == "__main__":
+    run()
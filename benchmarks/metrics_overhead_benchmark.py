@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Callable
+
+from reservation_system.metrics import Metrics
+from reservation_system.reservation_manager import ReservationManager
+
+BOOKINGS = 20_000
+QUERIES = 50_000
+REPEATS = 5
+
+
+def book_history(manager: ReservationManager, first_day: datetime) -> None:
+    for booking in range(BOOKINGS):
+        manager.make_a_reservation(
+            f"Player {booking}",
+            first_day + timedelta(days=booking // 20, minutes=30 * (booking % 20)),
+            30,
+        )
+
+
+def query_days(
+    find_reservation_in_range: Callable[..., Any], first_day: datetime
+) -> None:
+    for query in range(QUERIES):
+        day = first_day + timedelta(days=query % (BOOKINGS // 20))
+        find_reservation_in_range(day, day + timedelta(hours=10))
+
+
+def best_of(call: Callable[[], None]) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = perf_counter()
+        call()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def run() -> None:
+    first_day = (datetime.today() + timedelta(days=2)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    manager = ReservationManager(metrics=Metrics(enabled=False))
+    started = perf_counter()
+    book_history(manager, first_day)
+    disabled_booking_seconds = perf_counter() - started
+
+    instrumented_manager = ReservationManager(metrics=Metrics(enabled=True))
+    started = perf_counter()
+    book_history(instrumented_manager, first_day)
+    enabled_booking_seconds = perf_counter() - started
+
+    disabled_seconds = best_of(
+        lambda: query_days(manager.find_reservation_in_range, first_day)
+    )
+    enabled_seconds = best_of(
+        lambda: query_days(instrumented_manager.find_reservation_in_range, first_day)
+    )
+
+    print(f"{BOOKINGS} bookings")
+    print(f"{'metrics disabled':<20} {disabled_booking_seconds:>8.3f} s")
+    print(f"{'metrics enabled':<20} {enabled_booking_seconds:>8.3f} s")
+    print(f"{QUERIES} one-day range queries")
+    baseline_seconds = disabled_seconds
+    for label, seconds in [
+        ("metrics disabled", disabled_seconds),
+        ("metrics enabled", enabled_seconds),
+    ]:
+        print(
+            f"{label:<20} {seconds:>8.3f} s "
+            f"{seconds / QUERIES * 1_000_000:>8.2f} us/query "
+            f"{(seconds / baseline_seconds - 1) * 100:>+7.1f}%"
+        )
+    print()
+    print(instrumented_manager.metrics.to_text())
+
+
+if __name__ == "__main__":
+    run()
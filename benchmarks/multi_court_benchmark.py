@@ -0,0 +1,69 @@
+import random
+from datetime import datetime, timedelta
+from timeit import timeit
+
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+COURT_COUNTS = [1, 12, 48]
+DAYS = 365
+FILL_RATE = 0.9
+QUERIES = 200
+
+
+def fill_courts(manager: ReservationManager, first_day: datetime) -> None:
+    for court in manager.courts:
+        for day in range(DAYS):
+            start_date = first_day + timedelta(days=day)
+            for slot in range(20):
+                if random.random() < FILL_RATE:
+                    manager._add_reservation(
+                        Reservation(
+                            f"Player {slot}",
+                            start_date + timedelta(minutes=30 * slot),
+                            start_date + timedelta(minutes=30 * (slot + 1)),
+                            court,
+                        )
+                    )
+
+
+def earliest_by_scanning_courts(
+    manager: ReservationManager, start_date: datetime, duration: int
+) -> tuple[datetime, int]:
+    return min(
+        (manager.find_nearest_available_slot(start_date, duration, court), court)
+        for court in manager.courts
+    )
+
+
+def run() -> None:
+    first_day = datetime(2030, 1, 1, 8, 0)
+    print(f"{'courts':>6} {'earliest court [ms]':>20} {'per-court scan [ms]':>20}")
+    for court_count in COURT_COUNTS:
+        manager = ReservationManager(courts=range(1, court_count + 1))
+        fill_courts(manager, first_day)
+        queries = [
+            first_day
+            + timedelta(days=random.randrange(DAYS), hours=random.randrange(10))
+            for _ in range(QUERIES)
+        ]
+        merged_seconds = timeit(
+            lambda: [
+                manager.find_earliest_available_court(query, 90) for query in queries
+            ],
+            number=1,
+        )
+        scan_seconds = timeit(
+            lambda: [
+                earliest_by_scanning_courts(manager, query, 90) for query in queries
+            ],
+            number=1,
+        )
+        print(
+            f"{court_count:>6} {merged_seconds / QUERIES * 1000:>20.3f} "
+            f"{scan_seconds / QUERIES * 1000:>20.3f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,99 @@
+import random
+from datetime import datetime, timedelta
+from timeit import timeit
+
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+DAYS = 365
+FILL_RATES = [0.3, 0.7, 0.95]
+QUERIES = 100_000
+MONTH_QUERIES = 200
+
+
+def fill_court(
+    manager: ReservationManager, first_day: datetime, fill_rate: float
+) -> None:
+    for day in range(DAYS):
+        start_date = first_day + timedelta(days=day)
+        for slot in range(20):
+            if random.random() < fill_rate:
+                manager._add_reservation(
+                    Reservation(
+                        f"Player {slot}",
+                        start_date + timedelta(minutes=30 * slot),
+                        start_date + timedelta(minutes=30 * (slot + 1)),
+                    )
+                )
+
+
+def is_court_available_by_index(
+    manager: ReservationManager, start_date: datetime, end_date: datetime
+) -> bool:
+    with manager._state_lock:
+        storage = manager._court_storage(1)
+        return storage.first_overlapping(start_date, end_date) is None
+
+
+def run() -> None:
+    first_day = datetime(2030, 1, 1, 8, 0)
+    print(
+        f"{'fill':>5} {'available bitmap [us]':>22} {'available index [us]':>21} "
+        f"{'month bitmap [ms]':>18} {'month scan [ms]':>16}"
+    )
+    for fill_rate in FILL_RATES:
+        manager = ReservationManager()
+        fill_court(manager, first_day, fill_rate)
+        queries = [
+            (start_date, start_date + timedelta(minutes=random.choice([30, 60, 90])))
+            for start_date in (
+                first_day
+                + timedelta(
+                    days=random.randrange(DAYS), minutes=30 * random.randrange(17)
+                )
+                for _ in range(QUERIES)
+            )
+        ]
+        months = [
+            first_day.replace(hour=0) + timedelta(days=random.randrange(DAYS - 31))
+            for _ in range(MONTH_QUERIES)
+        ]
+        manager.find_free_windows(first_day, first_day + timedelta(days=DAYS))
+        bitmap_seconds = timeit(
+            lambda: [manager.is_court_available(start, end) for start, end in queries],
+            number=1,
+        )
+        index_seconds = timeit(
+            lambda: [
+                is_court_available_by_index(manager, start, end)
+                for start, end in queries
+            ],
+            number=1,
+        )
+        month_bitmap_seconds = timeit(
+            lambda: [
+                manager.find_free_windows(month, month + timedelta(days=31))
+                for month in months
+            ],
+            number=1,
+        )
+        month_scan_seconds = timeit(
+            lambda: [
+                [
+                    manager._scan_free_windows(1, (month + timedelta(days=day)).date())
+                    for day in range(31)
+                ]
+                for month in months
+            ],
+            number=1,
+        )
+        print(
+            f"{fill_rate:>5} {bitmap_seconds / QUERIES * 1e6:>22.2f} "
+            f"{index_seconds / QUERIES * 1e6:>21.2f} "
+            f"{month_bitmap_seconds / MONTH_QUERIES * 1000:>18.3f} "
+            f"{month_scan_seconds / MONTH_QUERIES * 1000:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,99 @@
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from benchmarks.schedule_generator import generate_schedule
+from reservation_system.const import FileType
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+USERS = 100_000
+DAYS = 1_095
+COURTS = 32
+FILL_RATE = 0.8
+INVALID_ROWS_SHARE = 0.01
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+FIRST_DAY = datetime(2030, 1, 7)
+
+
+def with_invalid_rows(schedule: list[Reservation]) -> list[Reservation]:
+    generator = random.Random(0)
+    rows = list(schedule)
+    for reservation in generator.sample(
+        schedule, int(len(schedule) * INVALID_ROWS_SHARE)
+    ):
+        rows.append(
+            generator.choice(
+                [
+                    Reservation(
+                        reservation.full_name,
+                        reservation.start_date.replace(hour=7),
+                        reservation.start_date.replace(hour=8),
+                        reservation.court,
+                    ),
+                    Reservation(
+                        reservation.full_name,
+                        reservation.start_date,
+                        reservation.start_date + timedelta(minutes=15),
+                        reservation.court,
+                    ),
+                    Reservation(
+                        f"Double {reservation.full_name}",
+                        reservation.start_date,
+                        reservation.end_date,
+                        reservation.court,
+                    ),
+                ]
+            )
+        )
+    generator.shuffle(rows)
+    return rows
+
+
+def run() -> None:
+    rows = with_invalid_rows(generate_schedule(USERS, DAYS, FILL_RATE, COURTS))
+    courts = range(1, COURTS + 1)
+    cpu_count = os.cpu_count() or 1
+    worker_counts = [workers for workers in WORKER_COUNTS if workers <= cpu_count]
+    print(f"{len(rows)} rows, {cpu_count} CPUs")
+    print(
+        f"{'file':>5} {'mode':>18} {'seconds':>8} {'speedup':>8} "
+        f"{'imported':>9} {'conflicts':>10} {'rejected':>9}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for file_type in [FileType.CSV, FileType.JSON]:
+            name_of_file = os.path.join(directory, f"import.{file_type.lower()}")
+            ReservationManager.create_serializer(
+                name_of_file, file_type
+            ).save_reservations(rows)
+
+            manager = ReservationManager(courts=courts)
+            started = perf_counter()
+            manager.load_reservations_from_file(name_of_file, file_type)
+            load_seconds = perf_counter() - started
+            print(
+                f"{file_type:>5} {'load, no checks':>18} {load_seconds:>8.2f} "
+                f"{'':>8} {sum(map(len, manager.court_reservations.values())):>9}"
+            )
+            single_worker_seconds = None
+            for workers in worker_counts:
+                manager = ReservationManager(courts=courts)
+                started = perf_counter()
+                report = manager.import_reservations_from_file(
+                    name_of_file, file_type, workers=workers
+                )
+                seconds = perf_counter() - started
+                if single_worker_seconds is None:
+                    single_worker_seconds = seconds
+                print(
+                    f"{file_type:>5} {f'import, {workers} workers':>18} "
+                    f"{seconds:>8.2f} {single_worker_seconds / seconds:>7.2f}x "
+                    f"{report.imported:>9} {len(report.conflicts):>10} "
+                    f"{len(report.rejected):>9}"
+                )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from timeit import timeit
+
+from reservation_system.const import FileType
+from reservation_system.recurring_reservation import RecurringReservation
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+COURTS = 8
+WEEKS = 52 * 5
+MONTH_QUERIES = 50
+
+
+def weekly_players(first_day: datetime) -> list[RecurringReservation]:
+    return [
+        RecurringReservation(
+            f"Player {court}-{day}-{slot}",
+            first_day + timedelta(days=day, hours=slot),
+            first_day + timedelta(days=day, hours=slot + 1),
+            court,
+            until=first_day + timedelta(weeks=WEEKS),
+        )
+        for court in range(1, COURTS + 1)
+        for day in range(7)
+        for slot in range(10)
+    ]
+
+
+def expand(recurring_reservations: list[RecurringReservation]) -> list[Reservation]:
+    return [
+        occurrence
+        for recurring_reservation in recurring_reservations
+        for occurrence in recurring_reservation.iter_occurrences(
+            recurring_reservation.start_date,
+            recurring_reservation.until or datetime.max,
+        )
+    ]
+
+
+def run() -> None:
+    first_day = datetime(2030, 1, 7, 8, 0)
+    recurring_reservations = weekly_players(first_day)
+    occurrences = expand(recurring_reservations)
+    courts = range(1, COURTS + 1)
+    with_rules = ReservationManager(courts=courts)
+    with_rules.replace_reservations((), recurring_reservations)
+    expanded = ReservationManager(courts=courts)
+    expanded.replace_reservations(occurrences)
+    print(f"{len(recurring_reservations)} weekly rules, {len(occurrences)} occurrences")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, manager in [("rules", with_rules), ("expanded", expanded)]:
+            name_of_file = os.path.join(directory, f"{name}.bin")
+            manager.save_reservations_from_range(
+                first_day,
+                first_day + timedelta(weeks=WEEKS),
+                name_of_file,
+                FileType.BINARY,
+            )
+            month_seconds = timeit(
+                lambda: [
+                    manager.find_reservation_in_range(
+                        first_day + timedelta(weeks=week),
+                        first_day + timedelta(weeks=week + 4),
+                    )
+                    for week in range(0, WEEKS - 4, WEEKS // MONTH_QUERIES)
+                ],
+                number=1,
+            )
+            print(
+                f"{name:>9}: snapshot {os.path.getsize(name_of_file):>9} bytes, "
+                f"one month {month_seconds / MONTH_QUERIES * 1000:.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    run()
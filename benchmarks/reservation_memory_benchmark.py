@@ -0,0 +1,66 @@
+import gc
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable
+
+from benchmarks.interval_index_benchmark import generate_reservations
+from reservation_system.columnar_reservation_store import ColumnarReservationStore
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_index import ReservationIndex
+
+ROWS = 200_000
+
+
+class DictReservation:
+    def __init__(
+        self, full_name: str, start_date: datetime, end_date: datetime
+    ) -> None:
+        self.full_name = full_name
+        self.start_date = start_date
+        self.end_date = end_date
+
+
+def copy_reservations(reservations: list[Reservation], factory: Callable) -> list:
+    return [
+        factory(
+            "".join(reservation.full_name),
+            reservation.start_date.replace(),
+            reservation.end_date.replace(),
+        )
+        for reservation in reservations
+    ]
+
+
+def measure(build: Callable[[], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size / ROWS
+
+
+def run() -> None:
+    reservations = generate_reservations(ROWS)
+    results = {
+        "list of __dict__ objects": measure(
+            lambda: copy_reservations(reservations, DictReservation)
+        ),
+        "list of __slots__ objects": measure(
+            lambda: copy_reservations(reservations, Reservation)
+        ),
+        "ReservationIndex": measure(
+            lambda: ReservationIndex(copy_reservations(reservations, Reservation))
+        ),
+        "ColumnarReservationStore": measure(
+            lambda: ColumnarReservationStore(iter(reservations))
+        ),
+    }
+    print(f"{ROWS} reservations")
+    for name, bytes_per_reservation in results.items():
+        print(f"{name:>26}: {bytes_per_reservation:.0f} bytes/reservation")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,102 @@
+import argparse
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from reservation_system.configuration import (
+    COURT_CLOSE_TIME,
+    COURT_OPEN_TIME,
+    MAX_RESERVATIONS_PER_WEEK,
+    MIN_SESSION_DURATION,
+)
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+DURATIONS = [30, 60, 90]
+DURATION_WEIGHTS = [2, 5, 3]
+USER_ATTEMPTS = 5
+
+
+def generate_schedule(
+    users: int,
+    days: int,
+    fill_rate: float,
+    courts: int = 1,
+    first_day: datetime = datetime(2030, 1, 7),
+    seed: int = 0,
+) -> list[Reservation]:
+    return list(iter_schedule(users, days, fill_rate, courts, first_day, seed))
+
+
+def iter_schedule(
+    users: int,
+    days: int,
+    fill_rate: float,
+    courts: int = 1,
+    first_day: datetime = datetime(2030, 1, 7),
+    seed: int = 0,
+) -> Iterator[Reservation]:
+    generator = random.Random(seed)
+    weekly_reservations: Counter[tuple[int, int, int]] = Counter()
+    session = timedelta(minutes=MIN_SESSION_DURATION)
+    mean_sessions = sum(
+        duration / MIN_SESSION_DURATION * weight
+        for duration, weight in zip(DURATIONS, DURATION_WEIGHTS)
+    ) / sum(DURATION_WEIGHTS)
+    start_probability = fill_rate / (mean_sessions * (1 - fill_rate) + fill_rate)
+    for day in range(days):
+        current_day = first_day.date() + timedelta(days=day)
+        year, week, _ = current_day.isocalendar()
+        day_close = datetime.combine(current_day, COURT_CLOSE_TIME)
+        for court in range(1, courts + 1):
+            start_date = datetime.combine(current_day, COURT_OPEN_TIME)
+            while start_date + session <= day_close:
+                if generator.random() >= start_probability:
+                    start_date += session
+                    continue
+                duration = generator.choices(DURATIONS, DURATION_WEIGHTS)[0]
+                end_date = min(start_date + timedelta(minutes=duration), day_close)
+                for _ in range(USER_ATTEMPTS):
+                    user = generator.randrange(users)
+                    week_key = user, year, week
+                    if weekly_reservations[week_key] < MAX_RESERVATIONS_PER_WEEK:
+                        weekly_reservations[week_key] += 1
+                        yield Reservation(f"User {user}", start_date, end_date, court)
+                        start_date = end_date
+                        break
+                else:
+                    start_date += session
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic reservation schedule."
+    )
+    parser.add_argument("output", help="name of the generated file")
+    parser.add_argument("--format", default="CSV", help="CSV, JSON or BIN")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--fill-rate", type=float, default=0.6)
+    parser.add_argument("--courts", type=int, default=1)
+    parser.add_argument("--first-day", default="07.01.2030")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    reservations = generate_schedule(
+        arguments.users,
+        arguments.days,
+        arguments.fill_rate,
+        arguments.courts,
+        datetime.strptime(arguments.first_day, "%d.%m.%Y"),
+        arguments.seed,
+    )
+    serializer = ReservationManager.create_serializer(
+        arguments.output, arguments.format
+    )
+    serializer.save_reservations(reservations)
+    print(f"{len(reservations)} reservations saved to {arguments.output}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,70 @@
+import io
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from itertools import islice
+from time import perf_counter
+from typing import Callable
+
+from benchmarks.export_benchmark import year_of_history
+from reservation_system.configuration import SCHEDULE_PAGE_SIZE
+from reservation_system.reservation_manager import ReservationManager
+from reservation_system.user_interface import UserInterface
+
+COURTS = 16
+RANGES_IN_DAYS = [7, 90, 365]
+
+
+def print_whole_range(
+    manager: ReservationManager, start_date: datetime, end_date: datetime
+) -> None:
+    schedule = manager.find_reservation_in_range(start_date, end_date)
+    for reservation in sorted(schedule, key=lambda r: r.start_date):
+        print(reservation)
+
+
+def print_first_page(
+    manager: ReservationManager, start_date: datetime, end_date: datetime
+) -> None:
+    schedule_text = UserInterface.iter_schedule_text(
+        manager.iter_reservation_in_range(start_date, end_date), SCHEDULE_PAGE_SIZE
+    )
+    print("".join(islice(schedule_text, SCHEDULE_PAGE_SIZE)))
+
+
+def measure(render: Callable[[], None]) -> tuple[float, float]:
+    with redirect_stdout(io.StringIO()):
+        started = perf_counter()
+        render()
+        seconds = perf_counter() - started
+        tracemalloc.start()
+        render()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def run() -> None:
+    first_day = datetime(2030, 1, 1, 8, 0)
+    manager = ReservationManager(courts=range(1, COURTS + 1))
+    manager.replace_reservations(year_of_history(first_day))
+    print(
+        f"{'days':>5} {'whole range [ms]':>17} {'first page [ms]':>16} "
+        f"{'whole range [MB]':>17} {'first page [MB]':>16}"
+    )
+    for days in RANGES_IN_DAYS:
+        end_date = first_day + timedelta(days=days)
+        whole_seconds, whole_peak = measure(
+            lambda: print_whole_range(manager, first_day, end_date)
+        )
+        page_seconds, page_peak = measure(
+            lambda: print_first_page(manager, first_day, end_date)
+        )
+        print(
+            f"{days:>5} {whole_seconds * 1000:>17.1f} {page_seconds * 1000:>16.2f} "
+            f"{whole_peak / 2**20:>17.2f} {page_peak / 2**20:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any
+
+from reservation_system.datetime_utils import format_datetime
+from reservation_system.reservation_manager import ReservationManager
+from reservation_system.reservation_server import ReservationServer
+
+CONNECTIONS = [1, 8, 32]
+PIPELINE_DEPTHS = [1, 16]
+REQUESTS_PER_CONNECTION = 2_000
+COURTS = 4
+DAYS = 60
+USERS = 5_000
+
+
+def random_request(
+    generator: random.Random, request_id: int, first_day: datetime
+) -> dict[str, Any]:
+    start_date = first_day + timedelta(
+        days=generator.randrange(DAYS), minutes=30 * generator.randrange(18)
+    )
+    method = generator.choices(["make", "schedule", "nearest"], [6, 3, 1])[0]
+    if method == "make":
+        params: dict[str, Any] = {
+            "name": f"Player {generator.randrange(USERS)}",
+            "start_time": format_datetime(start_date),
+            "duration": generator.choice([30, 60]),
+            "court": generator.randrange(1, COURTS + 1),
+        }
+    elif method == "schedule":
+        params = {
+            "start_time": format_datetime(start_date),
+            "end_time": format_datetime(start_date + timedelta(hours=4)),
+        }
+    else:
+        params = {"start_time": format_datetime(start_date), "duration": 60}
+    return {"id": request_id, "method": method, "params": params}
+
+
+async def drive_connection(
+    port: int, pipeline_depth: int, seed: int, first_day: datetime
+) -> list[float]:
+    generator = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    in_flight = asyncio.Semaphore(pipeline_depth)
+    sent_at: dict[int, float] = {}
+    latencies: list[float] = []
+
+    async def send_requests() -> None:
+        for request_id in range(REQUESTS_PER_CONNECTION):
+            await in_flight.acquire()
+            request = random_request(generator, request_id, first_day)
+            sent_at[request_id] = perf_counter()
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+
+    sender = asyncio.create_task(send_requests())
+    for _ in range(REQUESTS_PER_CONNECTION):
+        response = json.loads(await reader.readline())
+        latencies.append(perf_counter() - sent_at.pop(response["id"]))
+        in_flight.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+    return latencies
+
+
+async def measure(connections: int, pipeline_depth: int) -> None:
+    first_day = (datetime.today() + timedelta(days=2)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    manager = ReservationManager(courts=range(1, COURTS + 1))
+    server = await asyncio.start_server(
+        ReservationServer(manager).handle_connection, "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        started = perf_counter()
+        results = await asyncio.gather(
+            *(
+                drive_connection(port, pipeline_depth, seed, first_day)
+                for seed in range(connections)
+            )
+        )
+        seconds = perf_counter() - started
+    latencies = sorted(latency for result in results for latency in result)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"{connections:>11} {pipeline_depth:>8} {len(latencies) / seconds:>12.0f} "
+        f"{p50:>8.2f} {p99:>8.2f}"
+    )
+
+
+def run() -> None:
+    print(
+        f"{'connections':>11} {'pipeline':>8} {'requests/s':>12} {'p50 ms':>8} {'p99 ms':>8}"
+    )
+    for connections in CONNECTIONS:
+        for pipeline_depth in PIPELINE_DEPTHS:
+            asyncio.run(measure(connections, pipeline_depth))
+
+
+if __name__ == "__main__":
+    run()
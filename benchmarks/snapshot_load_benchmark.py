@@ -0,0 +1,34 @@
+import os
+import tempfile
+from timeit import timeit
+
+from benchmarks.interval_index_benchmark import generate_reservations
+from reservation_system.const import FileType
+from reservation_system.reservation_manager import ReservationManager
+
+ROWS = 1_000_000
+
+
+def run() -> None:
+    reservations = generate_reservations(ROWS)
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{ROWS} reservations")
+        for file_type in [FileType.CSV, FileType.JSON, FileType.BINARY]:
+            name_of_file = os.path.join(directory, f"schedule.{file_type.lower()}")
+            ReservationManager.create_serializer(
+                name_of_file, file_type
+            ).save_reservations(reservations)
+            for columnar in [False, True]:
+                manager = ReservationManager(columnar=columnar)
+                seconds = timeit(
+                    lambda: manager.load_reservations_from_file(
+                        name_of_file, file_type
+                    ),
+                    number=1,
+                )
+                storage = "columnar" if columnar else "index"
+                print(f"{file_type:>5} {storage:>9}: {seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,119 @@
+import random
+import tracemalloc
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from time import perf_counter
+from typing import Callable, Optional
+
+from benchmarks.schedule_generator import generate_schedule
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+from reservation_system.user_reservation_index import UserReservationIndex
+
+USERS = 20_000
+DAYS = 365
+COURTS = 16
+FILL_RATE = 0.7
+QUERIES = 2_000
+UPCOMING_LIMIT = 10
+FIRST_DAY = datetime(2030, 1, 7)
+
+
+def find_by_scanning_courts(
+    manager: ReservationManager, full_name: str, start_date: datetime
+) -> Optional[Reservation]:
+    for storage in manager.court_reservations.values():
+        for reservation in storage.find_by_start_date(start_date):
+            if reservation.full_name == full_name:
+                return reservation
+    return None
+
+
+def upcoming_by_scanning_schedule(
+    manager: ReservationManager, full_name: str, start_date: datetime
+) -> list[Reservation]:
+    return list(
+        islice(
+            (
+                reservation
+                for reservation in manager.iter_reservation_in_range(
+                    start_date, datetime.max - timedelta(days=1)
+                )
+                if reservation.full_name == full_name
+                and reservation.start_date >= start_date
+            ),
+            UPCOMING_LIMIT,
+        )
+    )
+
+
+def per_query_us(call: Callable[[Reservation], object], queries: list) -> float:
+    started = perf_counter()
+    for query in queries:
+        call(query)
+    return (perf_counter() - started) / len(queries) * 1_000_000
+
+
+def run() -> None:
+    schedule = generate_schedule(USERS, DAYS, FILL_RATE, COURTS, FIRST_DAY)
+    manager = ReservationManager(courts=range(1, COURTS + 1))
+    manager.replace_reservations(schedule)
+    queries = random.Random(0).sample(schedule, QUERIES)
+    print(f"{len(schedule)} reservations, {USERS} users, {COURTS} courts")
+
+    entries = list(
+        chain.from_iterable(
+            storage.iter_user_entries()
+            for storage in manager.court_reservations.values()
+        )
+    )
+    started = perf_counter()
+    UserReservationIndex(entries)
+    build_seconds = perf_counter() - started
+    tracemalloc.start()
+    user_reservations = UserReservationIndex(entries)
+    index_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"bulk build {build_seconds * 1000:.1f} ms, "
+        f"{index_bytes / 2**20:.1f} MB ({index_bytes / len(user_reservations):.0f} "
+        f"bytes per reservation)"
+    )
+
+    def find_by_user(query: Reservation) -> Optional[Reservation]:
+        return manager.find_client_reservation(query.full_name, query.start_date)
+
+    def upcoming_by_user(query: Reservation) -> list[Reservation]:
+        return manager.find_upcoming_reservations(
+            query.full_name, UPCOMING_LIMIT, FIRST_DAY
+        )
+
+    find_by_user(queries[0])
+    upcoming_queries = queries[: QUERIES // 20]
+    print(f"{'query':<26} {'scan us':>9} {'user index us':>14}")
+    for name, scan, by_user, measured_queries in [
+        (
+            "find for cancellation",
+            lambda query: find_by_scanning_courts(
+                manager, query.full_name, query.start_date
+            ),
+            find_by_user,
+            queries,
+        ),
+        (
+            "upcoming reservations",
+            lambda query: upcoming_by_scanning_schedule(
+                manager, query.full_name, FIRST_DAY
+            ),
+            upcoming_by_user,
+            upcoming_queries,
+        ),
+    ]:
+        print(
+            f"{name:<26} {per_query_us(scan, measured_queries):>9.1f} "
+            f"{per_query_us(by_user, measured_queries):>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from reservation_system.reservation import Reservation
+
+
+class BulkResult:
+    __slots__ = ("reservation", "error", "applied")
+
+    def __init__(
+        self,
+        reservation: Optional[Reservation],
+        error: Optional[Exception] = None,
+        applied: bool = False,
+    ) -> None:
+        self.reservation = reservation
+        self.error = error
+        self.applied = applied
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkResult({self.reservation!r}, {self.error!r}, "
+            f"applied={self.applied!r})"
+        )
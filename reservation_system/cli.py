@@ -0,0 +1,226 @@
+import argparse
+import sys
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Sequence
+
+from reservation_system.configuration import (
+    COLUMNAR_STORAGE,
+    DEFAULT_COURT,
+    JOURNAL_FILE,
+    SNAPSHOT_FILE,
+)
+from reservation_system.const import FileType
+from reservation_system.datetime_utils import parse_datetime
+from reservation_system.errors import WrongDataFormat
+from reservation_system.file_utils import GZIP_SUFFIX
+from reservation_system.messages import CANCEL_ERROR_MESSAGES, ERROR_MESSAGES
+from reservation_system.reservation_manager import ReservationManager
+
+TODAY = "today"
+NOW = "now"
+FILE_SUFFIX_TYPES = {
+    ".csv": FileType.CSV,
+    ".json": FileType.JSON,
+    ".bin": FileType.BINARY,
+}
+Command = Callable[[ReservationManager, argparse.Namespace], None]
+
+
+def parse_cli_datetime(text: str) -> datetime:
+    if text == NOW:
+        return datetime.today().replace(second=0, microsecond=0)
+    if text.startswith(TODAY):
+        offset = text[len(TODAY) :]
+        today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+        try:
+            return today + timedelta(days=int(offset or 0))
+        except ValueError:
+            pass
+    try:
+        return parse_datetime(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"{text!r} is not a date. Use DD.MM.YYYY HH:MM, {NOW}, {TODAY}, "
+            f"{TODAY}+N or {TODAY}-N"
+        )
+
+
+def file_type_from_name(name_of_file: str) -> str:
+    name = name_of_file.lower()
+    if name.endswith(GZIP_SUFFIX):
+        name = name[: -len(GZIP_SUFFIX)]
+    for suffix, file_type in FILE_SUFFIX_TYPES.items():
+        if name.endswith(suffix):
+            return file_type
+    raise ValueError(
+        f"Cannot tell the format of {name_of_file}, choose it with --format."
+    )
+
+
+def book(
+    reservation_manager: ReservationManager, arguments: argparse.Namespace
+) -> None:
+    if arguments.every_weeks is None and arguments.until is None:
+        reservation_manager.make_a_reservation(
+            arguments.name, arguments.start, arguments.duration, arguments.court
+        )
+    else:
+        reservation_manager.make_a_recurring_reservation(
+            arguments.name,
+            arguments.start,
+            arguments.duration,
+            arguments.court,
+            arguments.every_weeks or 1,
+            arguments.until,
+        )
+    print("Your reservation has been done and added to schedule.")
+
+
+def cancel(
+    reservation_manager: ReservationManager, arguments: argparse.Namespace
+) -> None:
+    if arguments.series:
+        reservation_manager.cancel_recurring_reservation(
+            arguments.name, arguments.start, arguments.court
+        )
+    else:
+        reservation_manager.delete_a_reservation(
+            arguments.name, arguments.start, arguments.court
+        )
+    print("Your reservation has been deleted.")
+
+
+def schedule(
+    reservation_manager: ReservationManager, arguments: argparse.Namespace
+) -> None:
+    from reservation_system.user_interface import UserInterface
+
+    reservations = reservation_manager.iter_reservation_in_range(
+        arguments.start, arguments.end, arguments.court
+    )
+    sys.stdout.writelines(
+        UserInterface.iter_schedule_text(
+            reservations, show_court=len(reservation_manager.courts) > 1
+        )
+    )
+
+
+def export(
+    reservation_manager: ReservationManager, arguments: argparse.Namespace
+) -> None:
+    reservation_manager.save_reservations_from_range(
+        arguments.start,
+        arguments.end,
+        arguments.file,
+        arguments.format or file_type_from_name(arguments.file),
+        arguments.compact,
+    )
+    print(f"The Schedule has been saved to {arguments.file} file")
+
+
+def import_file(
+    reservation_manager: ReservationManager, arguments: argparse.Namespace
+) -> None:
+    report = reservation_manager.import_reservations_from_file(
+        arguments.file,
+        arguments.format or file_type_from_name(arguments.file),
+        arguments.merge,
+        arguments.workers,
+    )
+    print(f"{report.imported} reservations have been loaded from {arguments.file} file")
+    if report.conflicts:
+        print(
+            f"{len(report.conflicts)} reservations were skipped because the court "
+            f"is already reserved at that time:"
+        )
+        for conflict in report.conflicts:
+            print(conflict.describe(len(reservation_manager.courts) > 1))
+    if report.rejected:
+        print(f"{len(report.rejected)} rows were rejected:")
+        for rejected_row in report.rejected:
+            print(rejected_row)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="reservation_system",
+        description="Tennis court reservation system. "
+        "Run without a command for the interactive menu.",
+    )
+    parser.add_argument("--journal", default=JOURNAL_FILE)
+    parser.add_argument("--snapshot", default=SNAPSHOT_FILE)
+    parser.set_defaults(error_messages=ERROR_MESSAGES)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    book_parser = commands.add_parser("book", help="make a reservation")
+    book_parser.add_argument("name")
+    book_parser.add_argument("start", type=parse_cli_datetime)
+    book_parser.add_argument("duration", type=int, help="minutes")
+    book_parser.add_argument("--court", type=int, default=DEFAULT_COURT)
+    book_parser.add_argument(
+        "--every-weeks", type=int, default=None, help="repeat every N weeks"
+    )
+    book_parser.add_argument(
+        "--until", type=parse_cli_datetime, default=None, help="last repetition"
+    )
+    book_parser.set_defaults(handler=book)
+
+    cancel_parser = commands.add_parser("cancel", help="cancel a reservation")
+    cancel_parser.add_argument("name")
+    cancel_parser.add_argument("start", type=parse_cli_datetime)
+    cancel_parser.add_argument("--court", type=int, default=None)
+    cancel_parser.add_argument(
+        "--series",
+        action="store_true",
+        help="also cancel all later repetitions of a recurring reservation",
+    )
+    cancel_parser.set_defaults(handler=cancel, error_messages=CANCEL_ERROR_MESSAGES)
+
+    schedule_parser = commands.add_parser("schedule", help="print the schedule")
+    schedule_parser.add_argument("start", type=parse_cli_datetime)
+    schedule_parser.add_argument("end", type=parse_cli_datetime)
+    schedule_parser.add_argument("--court", type=int, default=None)
+    schedule_parser.set_defaults(handler=schedule)
+
+    file_types = [FileType.CSV, FileType.JSON, FileType.BINARY]
+    export_parser = commands.add_parser("export", help="save the schedule to a file")
+    export_parser.add_argument("start", type=parse_cli_datetime)
+    export_parser.add_argument("end", type=parse_cli_datetime)
+    export_parser.add_argument("file")
+    export_parser.add_argument("--format", type=str.upper, choices=file_types)
+    export_parser.add_argument("--compact", action="store_true")
+    export_parser.set_defaults(handler=export)
+
+    import_parser = commands.add_parser("import", help="load reservations from a file")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--format", type=str.upper, choices=file_types)
+    import_parser.add_argument("--merge", action="store_true")
+    import_parser.add_argument("--workers", type=int, default=None)
+    import_parser.set_defaults(handler=import_file)
+    return parser
+
+
+def run(argv: Optional[Sequence[str]] = None) -> int:
+    arguments = create_parser().parse_args(argv)
+    command: Command = arguments.handler
+    error_messages: dict[type[Exception], str] = arguments.error_messages
+    reservation_manager = ReservationManager(columnar=COLUMNAR_STORAGE)
+    reservation_manager.open_journal(arguments.journal, arguments.snapshot)
+    try:
+        command(reservation_manager, arguments)
+    except tuple(error_messages) as error:
+        print(error_messages[type(error)], file=sys.stderr)
+        return 1
+    except FileNotFoundError as error:
+        print(f"The file {error.filename} does not exist", file=sys.stderr)
+        return 1
+    except (ValueError, WrongDataFormat) as error:
+        print(error, file=sys.stderr)
+        return 1
+    finally:
+        reservation_manager.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
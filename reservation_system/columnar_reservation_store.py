@@ -0,0 +1,170 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+from reservation_system.configuration import DEFAULT_COURT
+from reservation_system.datetime_utils import (
+    from_epoch_minutes,
+    to_epoch_minutes,
+    to_epoch_minutes_rounded_up,
+)
+from reservation_system.reservation import Reservation
+
+
+class ColumnarReservationStore:
+    def __init__(
+        self, reservations: Iterable[Reservation] = (), court: int = DEFAULT_COURT
+    ) -> None:
+        self.court = court
+        self._start_minutes = array("q")
+        self._end_minutes = array("q")
+        self._name_ids = array("i")
+        self._names: list[str] = []
+        self._name_ids_by_name: dict[str, int] = {}
+        self._max_duration = 0
+        for reservation in reservations:
+            self.append(reservation)
+        self.sort()
+
+    @classmethod
+    def from_columns(
+        cls,
+        start_minutes: memoryview,
+        end_minutes: memoryview,
+        name_ids: memoryview,
+        names: list[str],
+        court: int = DEFAULT_COURT,
+    ) -> "ColumnarReservationStore":
+        store = cls(court=court)
+        store._start_minutes.frombytes(start_minutes.cast("B"))
+        store._end_minutes.frombytes(end_minutes.cast("B"))
+        store._name_ids.frombytes(name_ids.cast("B"))
+        store._names = list(names)
+        store._name_ids_by_name = {name: name_id for name_id, name in enumerate(names)}
+        store._max_duration = max(
+            (end - start for start, end in zip(start_minutes, end_minutes)),
+            default=0,
+        )
+        return store
+
+    def __len__(self) -> int:
+        return len(self._start_minutes)
+
+    def __iter__(self) -> Iterator[Reservation]:
+        for position in range(len(self._start_minutes)):
+            yield self._materialize(position)
+
+    def iter_user_entries(self) -> Iterator[tuple[str, int, int]]:
+        names = self._names
+        court = self.court
+        for name_id, start_minute in zip(self._name_ids, self._start_minutes):
+            yield names[name_id], start_minute, court
+
+    def append(self, reservation: Reservation) -> None:
+        self._start_minutes.append(to_epoch_minutes(reservation.start_date))
+        self._end_minutes.append(to_epoch_minutes(reservation.end_date))
+        self._name_ids.append(self._name_id(reservation.full_name))
+
+    def sort(self) -> None:
+        order = sorted(
+            range(len(self._start_minutes)), key=self._start_minutes.__getitem__
+        )
+        self._start_minutes = array("q", (self._start_minutes[i] for i in order))
+        self._end_minutes = array("q", (self._end_minutes[i] for i in order))
+        self._name_ids = array("i", (self._name_ids[i] for i in order))
+        self._max_duration = max(
+            (end - start for start, end in zip(self._start_minutes, self._end_minutes)),
+            default=0,
+        )
+
+    def last_start_date(self) -> Optional[datetime]:
+        if not self._start_minutes:
+            return None
+        return from_epoch_minutes(self._start_minutes[-1])
+
+    def add(self, reservation: Reservation) -> None:
+        start_minute = to_epoch_minutes(reservation.start_date)
+        end_minute = to_epoch_minutes(reservation.end_date)
+        position = bisect_right(self._start_minutes, start_minute)
+        self._start_minutes.insert(position, start_minute)
+        self._end_minutes.insert(position, end_minute)
+        self._name_ids.insert(position, self._name_id(reservation.full_name))
+        self._max_duration = max(self._max_duration, end_minute - start_minute)
+
+    def remove(self, reservation: Reservation) -> None:
+        start_minute = to_epoch_minutes(reservation.start_date)
+        end_minute = to_epoch_minutes(reservation.end_date)
+        name_id = self._name_ids_by_name.get(reservation.full_name)
+        position = bisect_left(self._start_minutes, start_minute)
+        while (
+            position < len(self._start_minutes)
+            and self._start_minutes[position] == start_minute
+        ):
+            if (
+                self._end_minutes[position] == end_minute
+                and self._name_ids[position] == name_id
+            ):
+                del self._start_minutes[position]
+                del self._end_minutes[position]
+                del self._name_ids[position]
+                return
+            position += 1
+        raise ValueError("Reservation is not in the store.")
+
+    def find_by_start_date(self, start_date: datetime) -> list[Reservation]:
+        start_minute = to_epoch_minutes(start_date)
+        first = bisect_left(self._start_minutes, start_minute)
+        last = bisect_right(self._start_minutes, start_minute, lo=first)
+        return [self._materialize(position) for position in range(first, last)]
+
+    def starting_between(
+        self, start_date: datetime, end_date: datetime, limit: int
+    ) -> list[Reservation]:
+        first = bisect_left(
+            self._start_minutes, to_epoch_minutes_rounded_up(start_date)
+        )
+        last = bisect_left(
+            self._start_minutes, to_epoch_minutes_rounded_up(end_date), lo=first
+        )
+        if last - first > limit:
+            last = bisect_right(
+                self._start_minutes, self._start_minutes[first + limit - 1], lo=first
+            )
+        return [self._materialize(position) for position in range(first, last)]
+
+    def iter_overlapping(
+        self, start_date: datetime, end_date: datetime
+    ) -> Iterator[Reservation]:
+        start_minute = to_epoch_minutes(start_date)
+        first = bisect_right(self._start_minutes, start_minute - self._max_duration)
+        last = bisect_left(self._start_minutes, to_epoch_minutes(end_date), lo=first)
+        for position in range(first, last):
+            if self._end_minutes[position] > start_minute:
+                yield self._materialize(position)
+
+    def overlapping(
+        self, start_date: datetime, end_date: datetime
+    ) -> list[Reservation]:
+        return list(self.iter_overlapping(start_date, end_date))
+
+    def first_overlapping(
+        self, start_date: datetime, end_date: datetime
+    ) -> Optional[Reservation]:
+        return next(self.iter_overlapping(start_date, end_date), None)
+
+    def _materialize(self, position: int) -> Reservation:
+        return Reservation(
+            self._names[self._name_ids[position]],
+            from_epoch_minutes(self._start_minutes[position]),
+            from_epoch_minutes(self._end_minutes[position]),
+            self.court,
+        )
+
+    def _name_id(self, full_name: str) -> int:
+        name_id = self._name_ids_by_name.get(full_name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(full_name)
+            self._name_ids_by_name[full_name] = name_id
+        return name_id
@@ -1,3 +1,5 @@
+from datetime import time
+
 DATETIME_FORMAT = "%d.%m.%Y %H:%M"
 DATE_FORMAT = "%d.%m.%Y"
 TIME_FORMAT = "%H:%M"
@@ -5,3 +7,32 @@ COURT_OPEN = "8:00"
 COURT_CLOSE = "18:00"
 MAX_SESSION_DURATION = 90
 MIN_SESSION_DURATION = 30
+MAX_RESERVATIONS_PER_WEEK = 2
+MAX_FULL_WEEKS_SKIPPED = 52
+MAX_RECURRING_EVERY_WEEKS = 52
+SCHEDULE_PAGE_SIZE = 20
+UPCOMING_RESERVATIONS_LIMIT = 10
+NUMBER_OF_COURTS = 1
+DEFAULT_COURT = 1
+
+COURT_OPEN_TIME = time.fromisoformat(COURT_OPEN.zfill(5))
+COURT_CLOSE_TIME = time.fromisoformat(COURT_CLOSE.zfill(5))
+
+JOURNAL_FILE = "reservations.journal"
+SNAPSHOT_FILE = "reservations.snapshot"
+JOURNAL_SYNC_EVERY = 32
+JOURNAL_SYNC_INTERVAL_SECONDS = 1.0
+JOURNAL_COMPACT_EVERY = 10_000
+COLUMNAR_STORAGE = True
+
+RANGE_CHUNK_SIZE = 4096
+METRICS_ENABLED = False
+IMPORT_WORKERS = 0
+IMPORT_CHUNKS_PER_WORKER = 4
+IMPORT_MIN_CHUNK_BYTES = 1024 * 1024
+IMPORT_BATCH_SIZE = 20_000
+EXPORT_GZIP_LEVEL = 6
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_MAX_PIPELINED_REQUESTS = 64
@@ -5,13 +5,23 @@ class UserChoice:
     SAVE_SCHEDULE_TO_FILE = ["4", "SAVE SCHEDULE TO FILE"]
     EXIT = ["5", "EXIT"]
     LOAD_RESERVATIONS_FROM_FILE = ["6", "LOAD RESERVATIONS FROM FILE"]
+    SHOW_METRICS = ["7", "SHOW METRICS"]
+    SHOW_MY_RESERVATIONS = ["8", "SHOW MY RESERVATIONS"]
 
 
 class FileType:
     CSV = "CSV"
     JSON = "JSON"
+    BINARY = "BIN"
 
 
 class YesNoUserChoice:
     YES = "YES"
     NO = "NO"
+
+
+class JournalEvent:
+    MAKE = "MAKE"
+    CANCEL = "CANCEL"
+    RECURRING = "RECURRING"
+    CANCEL_RECURRING = "CANCEL_RECURRING"
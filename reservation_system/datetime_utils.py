@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from reservation_system.configuration import DATETIME_FORMAT
+
+PARSE_CACHE_SIZE = 4096
+FIXED_DATETIME_FORMAT = "%d.%m.%Y %H:%M"
+EPOCH = datetime(1970, 1, 1)
+ONE_MINUTE = timedelta(minutes=1)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_part(text: str) -> tuple[int, int, int]:
+    day, month, year = text[0:2], text[3:5], text[6:10]
+    if not (day + month + year).isdigit() or not text.isascii():
+        raise ValueError(text)
+    return int(year), int(month), int(day)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_time_part(text: str) -> tuple[int, int]:
+    hour, minute = text[0:2], text[3:5]
+    if not (hour + minute).isdigit() or not text.isascii():
+        raise ValueError(text)
+    return int(hour), int(minute)
+
+
+def parse_datetime(text: str) -> datetime:
+    if (
+        DATETIME_FORMAT == FIXED_DATETIME_FORMAT
+        and len(text) == 16
+        and text[2] == "."
+        and text[5] == "."
+        and text[10] == " "
+        and text[13] == ":"
+    ):
+        try:
+            year, month, day = _parse_date_part(text[0:10])
+            hour, minute = _parse_time_part(text[11:16])
+            return datetime(year, month, day, hour, minute)
+        except ValueError:
+            pass
+    return datetime.strptime(text, DATETIME_FORMAT)
+
+
+def format_datetime(date: datetime) -> str:
+    if DATETIME_FORMAT != FIXED_DATETIME_FORMAT:
+        return date.strftime(DATETIME_FORMAT)
+    return (
+        f"{date.day:02d}.{date.month:02d}.{date.year:04d} "
+        f"{date.hour:02d}:{date.minute:02d}"
+    )
+
+
+def iso_week(date: datetime) -> tuple[int, int]:
+    iso_year, iso_week_number, _ = date.isocalendar()
+    return iso_year, iso_week_number
+
+
+def to_epoch_minutes(date: datetime) -> int:
+    return (date - EPOCH) // ONE_MINUTE
+
+
+def to_epoch_minutes_rounded_up(date: datetime) -> int:
+    return -((EPOCH - date) // ONE_MINUTE)
+
+
+def from_epoch_minutes(minutes: int) -> datetime:
+    return EPOCH + timedelta(minutes=minutes)
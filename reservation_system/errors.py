@@ -20,3 +20,15 @@ class ReservationNoExist(Exception):
 
 class TooManyReservations(Exception):
     pass
+
+
+class CourtNoExist(Exception):
+    pass
+
+
+class WrongSessionDuration(Exception):
+    pass
+
+
+class UnknownMethod(Exception):
+    pass
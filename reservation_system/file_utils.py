@@ -0,0 +1,28 @@
+import gzip
+from typing import Optional, TextIO
+
+from reservation_system.configuration import EXPORT_GZIP_LEVEL
+
+GZIP_SUFFIX = ".gz"
+
+
+def is_gzip_file(file_name: str) -> bool:
+    return file_name.lower().endswith(GZIP_SUFFIX)
+
+
+def open_text_for_reading(file_name: str, newline: Optional[str] = None) -> TextIO:
+    if is_gzip_file(file_name):
+        return gzip.open(file_name, mode="rt", encoding="utf8", newline=newline)
+    return open(file_name, mode="r", encoding="utf8", newline=newline)
+
+
+def open_text_for_writing(file_name: str, newline: Optional[str] = None) -> TextIO:
+    if is_gzip_file(file_name):
+        return gzip.open(
+            file_name,
+            mode="wt",
+            compresslevel=EXPORT_GZIP_LEVEL,
+            encoding="utf8",
+            newline=newline,
+        )
+    return open(file_name, mode="w", encoding="utf8", newline=newline)
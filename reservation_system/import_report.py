@@ -0,0 +1,47 @@
+from typing import Optional, Union
+
+from reservation_system.recurring_reservation import RecurringReservation
+from reservation_system.reservation import Reservation
+
+
+class RejectedRow:
+    __slots__ = ("row_number", "reason", "reservation")
+
+    def __init__(
+        self,
+        row_number: int,
+        reason: str,
+        reservation: Optional[Union[Reservation, RecurringReservation]] = None,
+    ) -> None:
+        self.row_number = row_number
+        self.reason = reason
+        self.reservation = reservation
+
+    def __str__(self) -> str:
+        return f"row {self.row_number}: {self.reason}"
+
+    def __repr__(self) -> str:
+        return (
+            f"RejectedRow({self.row_number!r}, {self.reason!r}, "
+            f"{self.reservation!r})"
+        )
+
+
+class ImportReport:
+    __slots__ = ("imported", "conflicts", "rejected")
+
+    def __init__(
+        self,
+        imported: int = 0,
+        conflicts: Optional[list[Union[Reservation, RecurringReservation]]] = None,
+        rejected: Optional[list[RejectedRow]] = None,
+    ) -> None:
+        self.imported = imported
+        self.conflicts = conflicts if conflicts is not None else []
+        self.rejected = rejected if rejected is not None else []
+
+    def __repr__(self) -> str:
+        return (
+            f"ImportReport(imported={self.imported!r}, "
+            f"conflicts={len(self.conflicts)}, rejected={len(self.rejected)})"
+        )
@@ -0,0 +1,86 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterable, Iterator
+
+
+class KeyedLock:
+    __slots__ = ("lock", "holders")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.holders = 0
+
+
+class KeyedLocks:
+    def __init__(self) -> None:
+        self._locks: dict[Hashable, KeyedLock] = {}
+        self._guard = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._guard:
+            return len(self._locks)
+
+    def _claim(self, key: Hashable) -> KeyedLock:
+        with self._guard:
+            keyed_lock = self._locks.get(key)
+            if keyed_lock is None:
+                keyed_lock = self._locks[key] = KeyedLock()
+            keyed_lock.holders += 1
+            return keyed_lock
+
+    def _release(self, key: Hashable, keyed_lock: KeyedLock) -> None:
+        with self._guard:
+            keyed_lock.holders -= 1
+            if not keyed_lock.holders:
+                del self._locks[key]
+
+    @contextmanager
+    def hold(self, keys: Iterable[Any]) -> Iterator[None]:
+        claimed: list[tuple[Hashable, KeyedLock]] = []
+        try:
+            for key in sorted(set(keys)):
+                keyed_lock = self._claim(key)
+                keyed_lock.lock.acquire()
+                claimed.append((key, keyed_lock))
+            yield
+        finally:
+            for key, keyed_lock in reversed(claimed):
+                keyed_lock.lock.release()
+                self._release(key, keyed_lock)
+
+
+class SharedExclusiveLock:
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._shared_holders = 0
+        self._exclusive_holder = False
+        self._exclusive_waiting = 0
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._condition:
+            while self._exclusive_holder or self._exclusive_waiting:
+                self._condition.wait()
+            self._shared_holders += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._shared_holders -= 1
+                if self._shared_holders == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._condition:
+            self._exclusive_waiting += 1
+            while self._exclusive_holder or self._shared_holders:
+                self._condition.wait()
+            self._exclusive_waiting -= 1
+            self._exclusive_holder = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._exclusive_holder = False
+                self._condition.notify_all()
@@ -1,11 +1,27 @@
+import sys
+
+from reservation_system.configuration import (
+    COLUMNAR_STORAGE,
+    JOURNAL_FILE,
+    SNAPSHOT_FILE,
+)
 from reservation_system.reservation_manager import ReservationManager
-from reservation_system.user_interface import UserInterface
 
 
 def run() -> None:
-    reservation_manager = ReservationManager()
+    if len(sys.argv) > 1:
+        from reservation_system import cli
+
+        sys.exit(cli.run(sys.argv[1:]))
+    from reservation_system.user_interface import UserInterface
+
+    reservation_manager = ReservationManager(columnar=COLUMNAR_STORAGE)
+    reservation_manager.open_journal(JOURNAL_FILE, SNAPSHOT_FILE)
     user_interface = UserInterface(reservation_manager)
-    user_interface.main_menu()
+    try:
+        user_interface.main_menu()
+    finally:
+        reservation_manager.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+from reservation_system.configuration import (
+    COURT_CLOSE,
+    COURT_OPEN,
+    MAX_RESERVATIONS_PER_WEEK,
+    MAX_SESSION_DURATION,
+    MIN_SESSION_DURATION,
+)
+from reservation_system.errors import (
+    CourtIsClosed,
+    CourtNoExist,
+    LessThanHour,
+    ReservationNoExist,
+    SlotUnavailable,
+    TooManyReservations,
+    WrongSessionDuration,
+)
+
+COURT_IS_CLOSED_MESSAGE = f"Sorry Court is open from {COURT_OPEN} to {COURT_CLOSE}."
+COURT_NO_EXIST_MESSAGE = "Sorry but this court does not exist."
+LESS_THAN_HOUR_MESSAGE = (
+    "Sorry, you cannot make a reservation if there is less than an hour left "
+    "before it starts."
+)
+CANCEL_LESS_THAN_HOUR_MESSAGE = (
+    "Sorry, you cannot cancel a reservation if there is less than an hour left "
+    "before it starts."
+)
+RESERVATION_NO_EXIST_MESSAGE = "Sorry but this reservation is not exists."
+SLOT_UNAVAILABLE_MESSAGE = "Sorry but this time is not available."
+TOO_MANY_RESERVATIONS_MESSAGE = (
+    f"Sorry, you cannot make a reservation because you have "
+    f"{MAX_RESERVATIONS_PER_WEEK} active reservations that week."
+)
+WRONG_SESSION_DURATION_MESSAGE = (
+    f"Sorry, a reservation lasts from {MIN_SESSION_DURATION} to "
+    f"{MAX_SESSION_DURATION} minutes."
+)
+
+ERROR_MESSAGES: dict[type[Exception], str] = {
+    CourtIsClosed: COURT_IS_CLOSED_MESSAGE,
+    CourtNoExist: COURT_NO_EXIST_MESSAGE,
+    LessThanHour: LESS_THAN_HOUR_MESSAGE,
+    ReservationNoExist: RESERVATION_NO_EXIST_MESSAGE,
+    SlotUnavailable: SLOT_UNAVAILABLE_MESSAGE,
+    TooManyReservations: TOO_MANY_RESERVATIONS_MESSAGE,
+    WrongSessionDuration: WRONG_SESSION_DURATION_MESSAGE,
+}
+CANCEL_ERROR_MESSAGES = {**ERROR_MESSAGES, LessThanHour: CANCEL_LESS_THAN_HOUR_MESSAGE}
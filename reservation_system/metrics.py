@@ -0,0 +1,247 @@
+import json
+import threading
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, TypeVar, cast
+
+LATENCY_BUCKETS_SECONDS = (
+    0.00001,
+    0.00003,
+    0.0001,
+    0.0003,
+    0.001,
+    0.003,
+    0.01,
+    0.03,
+    0.1,
+    0.3,
+    1.0,
+    3.0,
+    10.0,
+)
+
+INSTRUMENTED_ATTRIBUTE = "__instrumented__"
+STREAMED_ATTRIBUTE = "__streamed__"
+
+Method = TypeVar("Method", bound=Callable[..., Any])
+Item = TypeVar("Item")
+
+
+class OperationMetrics:
+    __slots__ = (
+        "calls",
+        "errors",
+        "items",
+        "total_seconds",
+        "max_seconds",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.items = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)
+
+    def record(self, seconds: float, items: int, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.items += items
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.histogram[bisect_left(LATENCY_BUCKETS_SECONDS, seconds)] += 1
+
+    def percentile_seconds(self, fraction: float) -> float:
+        threshold = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= threshold and count:
+                if bucket == len(LATENCY_BUCKETS_SECONDS):
+                    return self.max_seconds
+                return min(LATENCY_BUCKETS_SECONDS[bucket], self.max_seconds)
+        return 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        bucket_names = [f"<={bound * 1000:g}ms" for bound in LATENCY_BUCKETS_SECONDS]
+        bucket_names.append(f">{LATENCY_BUCKETS_SECONDS[-1] * 1000:g}ms")
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "items": self.items,
+            "total_ms": self.total_seconds * 1000,
+            "mean_ms": self.total_seconds * 1000 / self.calls if self.calls else 0.0,
+            "p50_ms": self.percentile_seconds(0.5) * 1000,
+            "p99_ms": self.percentile_seconds(0.99) * 1000,
+            "max_ms": self.max_seconds * 1000,
+            "histogram": {
+                bucket_name: count
+                for bucket_name, count in zip(bucket_names, self.histogram)
+                if count
+            },
+        }
+
+
+class Metrics:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.operations: dict[str, OperationMetrics] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.operations = {}
+
+    def add_items(self, items: int) -> None:
+        item_counts = getattr(self._local, "item_counts", None)
+        if item_counts:
+            item_counts[-1] += items
+
+    def count_items(self, items: Iterable[Item]) -> Iterable[Item]:
+        if not self.enabled:
+            return items
+        return self._iter_counted(items)
+
+    def _iter_counted(self, items: Iterable[Item]) -> Iterator[Item]:
+        for item in items:
+            self.add_items(1)
+            yield item
+
+    def attach(self, target: Any) -> None:
+        self.enabled = True
+        for name in instrumented_names(target):
+            method = getattr(type(target), name)
+            wrap = (
+                self.wrap_stream
+                if getattr(method, STREAMED_ATTRIBUTE, False)
+                else self.wrap
+            )
+            setattr(target, name, wrap(name, method.__get__(target)))
+
+    def detach(self, target: Any) -> None:
+        self.enabled = False
+        for name in instrumented_names(target):
+            vars(target).pop(name, None)
+
+    def wrap(self, operation: str, method: Method) -> Method:
+        @wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.measure(operation, lambda: method(*args, **kwargs))
+
+        return cast(Method, wrapper)
+
+    def wrap_stream(self, operation: str, method: Method) -> Method:
+        @wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if getattr(self._local, "item_counts", None):
+                return method(*args, **kwargs)
+            started = perf_counter()
+            try:
+                items = iter(method(*args, **kwargs))
+            except BaseException:
+                self.record(operation, perf_counter() - started, 0, True)
+                raise
+            return self._iter_measured(operation, items, perf_counter() - started)
+
+        return cast(Method, wrapper)
+
+    def _iter_measured(
+        self, operation: str, items: Iterator[Item], seconds: float
+    ) -> Iterator[Item]:
+        count = 0
+        failed = True
+        try:
+            while True:
+                started = perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    failed = False
+                    return
+                finally:
+                    seconds += perf_counter() - started
+                count += 1
+                yield item
+        except GeneratorExit:
+            failed = False
+            raise
+        finally:
+            self.record(operation, seconds, count, failed)
+
+    def measure(self, operation: str, call: Callable[[], Any]) -> Any:
+        item_counts = getattr(self._local, "item_counts", None)
+        if item_counts is None:
+            item_counts = self._local.item_counts = []
+        item_counts.append(0)
+        failed = True
+        started = perf_counter()
+        try:
+            result = call()
+            failed = False
+            return result
+        finally:
+            seconds = perf_counter() - started
+            items = item_counts.pop()
+            if item_counts:
+                item_counts[-1] += items
+            else:
+                self.record(operation, seconds, items, failed)
+
+    def record(self, operation: str, seconds: float, items: int, failed: bool) -> None:
+        with self._lock:
+            operation_metrics = self.operations.get(operation)
+            if operation_metrics is None:
+                operation_metrics = self.operations[operation] = OperationMetrics()
+            operation_metrics.record(seconds, items, failed)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "operations": {
+                    operation: operation_metrics.snapshot()
+                    for operation, operation_metrics in sorted(self.operations.items())
+                },
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=3)
+
+    def to_text(self) -> str:
+        operations = self.snapshot()["operations"]
+        if not operations:
+            return "No operations have been recorded yet."
+        lines = [
+            f"{'operation':<30} {'calls':>7} {'errors':>7} {'items':>9} "
+            f"{'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+        ]
+        for operation, operation_metrics in operations.items():
+            lines.append(
+                f"{operation:<30} {operation_metrics['calls']:>7} "
+                f"{operation_metrics['errors']:>7} {operation_metrics['items']:>9} "
+                f"{operation_metrics['mean_ms']:>9.3f} "
+                f"{operation_metrics['p50_ms']:>9.3f} "
+                f"{operation_metrics['p99_ms']:>9.3f} "
+                f"{operation_metrics['max_ms']:>9.3f}"
+            )
+        return "\n".join(lines)
+
+
+def instrumented(method: Method) -> Method:
+    setattr(method, INSTRUMENTED_ATTRIBUTE, True)
+    return method
+
+
+def instrumented_stream(method: Method) -> Method:
+    setattr(method, STREAMED_ATTRIBUTE, True)
+    return instrumented(method)
+
+
+def instrumented_names(target: Any) -> Iterator[str]:
+    for name in dir(type(target)):
+        if getattr(getattr(type(target), name), INSTRUMENTED_ATTRIBUTE, False):
+            yield name
@@ -0,0 +1,141 @@
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+from reservation_system.configuration import (
+    COURT_CLOSE_TIME,
+    COURT_OPEN_TIME,
+    MIN_SESSION_DURATION,
+)
+from reservation_system.datetime_utils import ONE_MINUTE
+from reservation_system.reservation import Reservation
+
+MASK_CACHE_SIZE = 4096
+SLOT_MINUTES = MIN_SESSION_DURATION
+OPEN_MINUTE = COURT_OPEN_TIME.hour * 60 + COURT_OPEN_TIME.minute
+CLOSE_MINUTE = COURT_CLOSE_TIME.hour * 60 + COURT_CLOSE_TIME.minute
+SLOTS_PER_DAY = -(-(CLOSE_MINUTE - OPEN_MINUTE) // SLOT_MINUTES)
+ALL_SLOTS = (1 << SLOTS_PER_DAY) - 1
+
+DayMasks = tuple[int, int]
+DayKey = tuple[int, date]
+
+
+class OccupancyBitmaps:
+    def __init__(self) -> None:
+        self._day_masks: dict[DayKey, DayMasks] = {}
+
+    def get(self, court: int, day: date) -> Optional[DayMasks]:
+        return self._day_masks.get((court, day))
+
+    def build(
+        self, court: int, day: date, reservations: Iterable[Reservation]
+    ) -> DayMasks:
+        touched = full = 0
+        for reservation in reservations:
+            reservation_touched, reservation_full = self.interval_masks(
+                reservation.start_date, reservation.end_date, day
+            )
+            touched |= reservation_touched
+            full |= reservation_full
+        self._day_masks[court, day] = touched, full
+        return touched, full
+
+    def add(self, reservation: Reservation) -> None:
+        for day in self.days_of(reservation.start_date, reservation.end_date):
+            day_masks = self._day_masks.get((reservation.court, day))
+            if day_masks is not None:
+                reservation_touched, reservation_full = self.interval_masks(
+                    reservation.start_date, reservation.end_date, day
+                )
+                self._day_masks[reservation.court, day] = (
+                    day_masks[0] | reservation_touched,
+                    day_masks[1] | reservation_full,
+                )
+
+    def discard(self, reservation: Reservation) -> None:
+        for day in self.days_of(reservation.start_date, reservation.end_date):
+            self._day_masks.pop((reservation.court, day), None)
+
+    def clear(self) -> None:
+        self._day_masks.clear()
+
+    @staticmethod
+    def days_of(start_date: datetime, end_date: datetime) -> Iterator[date]:
+        day = start_date.date()
+        while datetime.combine(day, time()) < end_date:
+            yield day
+            day += timedelta(days=1)
+
+    @staticmethod
+    def interval_masks(start_date: datetime, end_date: datetime, day: date) -> DayMasks:
+        midnight = datetime.combine(day, time())
+        return minute_masks(
+            (start_date - midnight) / ONE_MINUTE, (end_date - midnight) / ONE_MINUTE
+        )
+
+    @staticmethod
+    def query_masks(start_date: datetime, end_date: datetime) -> Optional[DayMasks]:
+        if (
+            start_date.second
+            or start_date.microsecond
+            or end_date.second
+            or end_date.microsecond
+        ):
+            return None
+        start_minute = start_date.hour * 60 + start_date.minute
+        end_minute = (end_date - start_date) // ONE_MINUTE + start_minute
+        if (
+            start_minute < OPEN_MINUTE
+            or end_minute > CLOSE_MINUTE
+            or end_minute <= start_minute
+        ):
+            return None
+        return minute_masks(start_minute, end_minute)
+
+    @staticmethod
+    def free_windows(day: date, occupied: int) -> Iterator[tuple[datetime, datetime]]:
+        day_open = datetime.combine(day, COURT_OPEN_TIME)
+        for window_start, window_end in free_window_offsets(occupied):
+            yield day_open + window_start, day_open + window_end
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def minute_masks(start_minute: float, end_minute: float) -> DayMasks:
+    start_minute = max(start_minute, OPEN_MINUTE)
+    end_minute = min(end_minute, CLOSE_MINUTE)
+    if end_minute <= start_minute:
+        return 0, 0
+    first_touched = int((start_minute - OPEN_MINUTE) // SLOT_MINUTES)
+    last_touched = int(-(-(end_minute - OPEN_MINUTE) // SLOT_MINUTES))
+    first_full = int(-(-(start_minute - OPEN_MINUTE) // SLOT_MINUTES))
+    if end_minute >= CLOSE_MINUTE:
+        last_full = SLOTS_PER_DAY
+    else:
+        last_full = int((end_minute - OPEN_MINUTE) // SLOT_MINUTES)
+    touched = (1 << last_touched) - (1 << first_touched)
+    full = (1 << last_full) - (1 << first_full) if last_full > first_full else 0
+    return touched, full
+
+
+@lru_cache(maxsize=MASK_CACHE_SIZE)
+def free_window_offsets(occupied: int) -> tuple[tuple[timedelta, timedelta], ...]:
+    free_windows = []
+    free = ALL_SLOTS & ~occupied
+    while free:
+        first_slot = (free & -free).bit_length() - 1
+        run = free >> first_slot
+        run_length = (~run & (run + 1)).bit_length() - 1
+        free_windows.append(
+            (
+                timedelta(minutes=first_slot * SLOT_MINUTES),
+                timedelta(
+                    minutes=min(
+                        (first_slot + run_length) * SLOT_MINUTES,
+                        CLOSE_MINUTE - OPEN_MINUTE,
+                    )
+                ),
+            )
+        )
+        free &= ~(((1 << run_length) - 1) << first_slot)
+    return tuple(free_windows)
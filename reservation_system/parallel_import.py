@@ -0,0 +1,287 @@
+import csv
+import gc
+import io
+import os
+import sys
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
+
+from reservation_system.configuration import (
+    DEFAULT_COURT,
+    IMPORT_BATCH_SIZE,
+    IMPORT_CHUNKS_PER_WORKER,
+    IMPORT_MIN_CHUNK_BYTES,
+    IMPORT_WORKERS,
+)
+from reservation_system.const import FileType
+from reservation_system.datetime_utils import parse_datetime
+from reservation_system.errors import CourtIsClosed, WrongSessionDuration
+from reservation_system.file_utils import is_gzip_file, open_text_for_reading
+from reservation_system.import_report import RejectedRow
+from reservation_system.recurring_reservation import RecurringReservation
+from reservation_system.reservation import Reservation, validate_interval
+from reservation_system.reservation_binary_serializer import (
+    ReservationBinarySerializer,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+REQUIRED_FIELDS = ("name", "start_time", "end_time")
+
+ParsedRow = tuple[int, datetime, datetime, str]
+ChunkResult = tuple[
+    list[ParsedRow], list[RejectedRow], list[tuple[int, dict[str, Any]]], int
+]
+
+
+class ParsedReservations:
+    __slots__ = ("rows", "rejected", "recurring_reservations")
+
+    def __init__(self) -> None:
+        self.rows: list[ParsedRow] = []
+        self.rejected: list[RejectedRow] = []
+        self.recurring_reservations: list[RecurringReservation] = []
+
+
+@contextmanager
+def paused_garbage_collection() -> Iterator[None]:
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def parse_rows(rows: Iterable[dict[str, Any]]) -> ChunkResult:
+    with paused_garbage_collection():
+        return _parse_rows(rows)
+
+
+def _parse_rows(rows: Iterable[dict[str, Any]]) -> ChunkResult:
+    parsed_rows: list[ParsedRow] = []
+    rejected: list[RejectedRow] = []
+    recurring_rows: list[tuple[int, dict[str, Any]]] = []
+    row_number = 0
+    for row_number, row in enumerate(rows, start=1):
+        if row.get("every_weeks"):
+            recurring_rows.append((row_number, row))
+            continue
+        missing_fields = [field for field in REQUIRED_FIELDS if not row.get(field)]
+        if missing_fields:
+            rejected.append(
+                RejectedRow(row_number, f"missing {', '.join(missing_fields)}")
+            )
+            continue
+        try:
+            full_name = str(row["name"])
+            start_date = parse_datetime(row["start_time"])
+            end_date = parse_datetime(row["end_time"])
+            court = int(row.get("court") or DEFAULT_COURT)
+        except (TypeError, ValueError) as error:
+            rejected.append(RejectedRow(row_number, f"wrong data format: {error}"))
+            continue
+        try:
+            validate_interval(start_date, end_date)
+        except (CourtIsClosed, WrongSessionDuration) as error:
+            rejected.append(
+                RejectedRow(
+                    row_number,
+                    str(error),
+                    Reservation(full_name, start_date, end_date, court),
+                )
+            )
+            continue
+        parsed_rows.append((court, start_date, end_date, full_name))
+    parsed_rows.sort()
+    return parsed_rows, rejected, recurring_rows, row_number
+
+
+def parse_csv_byte_range(
+    file_name: str, start: int, end: int, fieldnames: list[str]
+) -> ChunkResult:
+    with open(file_name, mode="rb") as reservations_file:
+        reservations_file.seek(start)
+        text = reservations_file.read(end - start).decode("utf8")
+    return parse_rows(csv.DictReader(io.StringIO(text, newline=""), fieldnames))
+
+
+def check_reservations(reservations: Iterable[Reservation]) -> ChunkResult:
+    parsed_rows: list[ParsedRow] = []
+    rejected: list[RejectedRow] = []
+    row_number = 0
+    for row_number, reservation in enumerate(reservations, start=1):
+        try:
+            validate_interval(reservation.start_date, reservation.end_date)
+        except (CourtIsClosed, WrongSessionDuration) as error:
+            rejected.append(RejectedRow(row_number, str(error), reservation))
+            continue
+        parsed_rows.append(
+            (
+                reservation.court,
+                reservation.start_date,
+                reservation.end_date,
+                reservation.full_name,
+            )
+        )
+    parsed_rows.sort()
+    return parsed_rows, rejected, [], row_number
+
+
+def plan_csv_byte_ranges(
+    file_name: str, chunks: int
+) -> tuple[list[str], list[tuple[int, int]]]:
+    size = os.path.getsize(file_name)
+    with open(file_name, mode="rb") as reservations_file:
+        header = reservations_file.readline()
+        boundaries = [reservations_file.tell()]
+        for chunk in range(1, chunks):
+            target = boundaries[0] + (size - boundaries[0]) * chunk // chunks
+            if target <= boundaries[-1]:
+                continue
+            reservations_file.seek(target)
+            reservations_file.readline()
+            boundary = reservations_file.tell()
+            if boundary >= size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+        boundaries.append(size)
+    fieldnames = next(csv.reader([header.decode("utf8")]), [])
+    return fieldnames, list(zip(boundaries, boundaries[1:]))
+
+
+def read_reservations(
+    file_name: str, file_type: str, workers: Optional[int] = None
+) -> ParsedReservations:
+    if workers is None:
+        workers = IMPORT_WORKERS or os.cpu_count() or 1
+    chunks = max(
+        1,
+        min(
+            workers * IMPORT_CHUNKS_PER_WORKER,
+            os.path.getsize(file_name) // IMPORT_MIN_CHUNK_BYTES,
+        ),
+    )
+    workers = min(workers, chunks)
+    tasks: Iterable[tuple[Callable[..., ChunkResult], tuple[Any, ...]]]
+    if file_type.upper() == FileType.CSV and not is_gzip_file(file_name):
+        fieldnames, byte_ranges = plan_csv_byte_ranges(file_name, chunks)
+        tasks = (
+            (parse_csv_byte_range, (file_name, start, end, fieldnames))
+            for start, end in byte_ranges
+        )
+    elif file_type.upper() == FileType.CSV:
+        tasks = (
+            (parse_rows, (batch,)) for batch in iter_batches(iter_csv_rows(file_name))
+        )
+    elif file_type.upper() == FileType.JSON:
+        from reservation_system.reservation_json_serializer import (
+            ReservationJSONSerializer,
+        )
+
+        serializer = ReservationJSONSerializer(file_name)
+        tasks = (
+            (parse_rows, (batch,))
+            for batch in iter_batches(
+                chain(
+                    serializer.iter_rows("recurring_reservations"),
+                    serializer.iter_rows(),
+                )
+            )
+        )
+    elif file_type.upper() == FileType.BINARY:
+        binary_serializer = ReservationBinarySerializer(file_name)
+        workers = 1
+        tasks = [(check_reservations, (binary_serializer.iter_reservations(),))]
+    else:
+        raise ValueError(f"{file_type} is not supported.")
+
+    parsed_reservations = ParsedReservations()
+    rows_before_chunk = 0
+    for parsed_rows, rejected, recurring_rows, row_count in run_tasks(tasks, workers):
+        parsed_reservations.rows.extend(parsed_rows)
+        for rejected_row in rejected:
+            rejected_row.row_number += rows_before_chunk
+            parsed_reservations.rejected.append(rejected_row)
+        for row_number, row in recurring_rows:
+            parse_recurring_row(
+                parsed_reservations, rows_before_chunk + row_number, row
+            )
+        rows_before_chunk += row_count
+    if file_type.upper() == FileType.BINARY:
+        for row_number, recurring_reservation in enumerate(
+            binary_serializer.iter_recurring_reservations(), start=rows_before_chunk + 1
+        ):
+            parse_recurring_row(
+                parsed_reservations, row_number, recurring_reservation.to_row()
+            )
+    parsed_reservations.rows.sort()
+    return parsed_reservations
+
+
+def parse_recurring_row(
+    parsed_reservations: ParsedReservations, row_number: int, row: dict[str, Any]
+) -> None:
+    try:
+        recurring_reservation = RecurringReservation.from_row(row)
+    except KeyError as error:
+        parsed_reservations.rejected.append(
+            RejectedRow(row_number, f"missing field {error}")
+        )
+        return
+    except (TypeError, ValueError) as error:
+        parsed_reservations.rejected.append(
+            RejectedRow(row_number, f"wrong data format: {error}")
+        )
+        return
+    try:
+        validate_interval(
+            recurring_reservation.start_date, recurring_reservation.end_date
+        )
+    except (CourtIsClosed, WrongSessionDuration) as error:
+        parsed_reservations.rejected.append(
+            RejectedRow(row_number, str(error), recurring_reservation)
+        )
+        return
+    recurring_reservation.full_name = sys.intern(recurring_reservation.full_name)
+    parsed_reservations.recurring_reservations.append(recurring_reservation)
+
+
+def iter_csv_rows(file_name: str) -> Iterator[dict[str, Any]]:
+    with open_text_for_reading(file_name, newline="") as reservations_file:
+        yield from csv.DictReader(reservations_file)
+
+
+def iter_batches(rows: Iterable[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, IMPORT_BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
+def run_tasks(
+    tasks: Iterable[tuple[Callable[..., ChunkResult], tuple[Any, ...]]],
+    workers: int,
+) -> Iterator[ChunkResult]:
+    if workers <= 1:
+        for function, arguments in tasks:
+            yield function(*arguments)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: "deque[Future[ChunkResult]]" = deque()
+        for function, arguments in tasks:
+            pending.append(executor.submit(function, *arguments))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
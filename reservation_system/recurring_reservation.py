@@ -0,0 +1,253 @@
+import math
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from reservation_system.configuration import (
+    DEFAULT_COURT,
+    MAX_RECURRING_EVERY_WEEKS,
+    NUMBER_OF_COURTS,
+)
+from reservation_system.datetime_utils import (
+    ONE_MINUTE,
+    format_datetime,
+    from_epoch_minutes,
+    parse_datetime,
+    to_epoch_minutes,
+)
+from reservation_system.reservation import Reservation
+
+RECURRING_FIELDS = ["every_weeks", "until", "exceptions"]
+EXCEPTIONS_SEPARATOR = ";"
+MINUTES_PER_WEEK = 7 * 24 * 60
+LAST_MINUTE = to_epoch_minutes(datetime.max.replace(second=0, microsecond=0))
+
+
+class RecurringReservation:
+    __slots__ = (
+        "full_name",
+        "start_date",
+        "end_date",
+        "court",
+        "every_weeks",
+        "until",
+        "exceptions",
+    )
+
+    def __init__(
+        self,
+        full_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        court: int = DEFAULT_COURT,
+        every_weeks: int = 1,
+        until: Optional[datetime] = None,
+        exceptions: Iterable[datetime] = (),
+    ) -> None:
+        if not 1 <= every_weeks <= MAX_RECURRING_EVERY_WEEKS:
+            raise ValueError(
+                f"A recurring reservation repeats every 1 to "
+                f"{MAX_RECURRING_EVERY_WEEKS} weeks."
+            )
+        self.full_name = full_name
+        self.start_date = start_date
+        self.end_date = end_date
+        self.court = court
+        self.every_weeks = every_weeks
+        self.until = until
+        self.exceptions = set(exceptions)
+
+    @property
+    def period(self) -> timedelta:
+        return timedelta(weeks=self.every_weeks)
+
+    @property
+    def duration(self) -> timedelta:
+        return self.end_date - self.start_date
+
+    def __str__(self) -> str:
+        return self.describe(show_court=NUMBER_OF_COURTS > 1)
+
+    def describe(self, show_court: bool) -> str:
+        description = (
+            f"* {self.full_name} "
+            f"{format_datetime(self.start_date)} - "
+            f"{format_datetime(self.end_date)} "
+            f"every {self.every_weeks} week(s) "
+        )
+        if self.until is not None:
+            description += f"until {format_datetime(self.until)} "
+        if show_court:
+            description += f"(court {self.court}) "
+        return description
+
+    def __repr__(self) -> str:
+        return (
+            f"RecurringReservation({self.full_name!r}, {self.start_date!r}, "
+            f"{self.end_date!r}, {self.court!r}, {self.every_weeks!r}, "
+            f"{self.until!r}, {sorted(self.exceptions)!r})"
+        )
+
+    def identity(self) -> tuple[str, datetime, int]:
+        return self.full_name, self.start_date, self.court
+
+    def occurs_at(self, start_date: datetime) -> bool:
+        if start_date < self.start_date or start_date in self.exceptions:
+            return False
+        if self.until is not None and start_date > self.until:
+            return False
+        return (start_date - self.start_date) % self.period == timedelta(0)
+
+    def occurrence(self, start_date: datetime) -> Reservation:
+        return Reservation(
+            self.full_name, start_date, start_date + self.duration, self.court
+        )
+
+    def iter_occurrences(
+        self, start_date: datetime, end_date: datetime
+    ) -> Iterator[Reservation]:
+        period = self.period
+        duration = self.duration
+        number = max((start_date - duration - self.start_date) // period, 0)
+        occurrence_start = self.start_date + number * period
+        while occurrence_start + duration <= start_date:
+            occurrence_start += period
+        last_start_date = datetime.max - period
+        while occurrence_start < end_date and (
+            self.until is None or occurrence_start <= self.until
+        ):
+            if occurrence_start not in self.exceptions:
+                yield self.occurrence(occurrence_start)
+            if occurrence_start > last_start_date:
+                return
+            occurrence_start += period
+
+    def first_overlapping(
+        self, start_date: datetime, end_date: datetime
+    ) -> Optional[Reservation]:
+        return next(self.iter_occurrences(start_date, end_date), None)
+
+    def first_overlap_with(
+        self, other: "RecurringReservation", start_date: datetime
+    ) -> Optional[datetime]:
+        start_minute = to_epoch_minutes(self.start_date)
+        other_start_minute = to_epoch_minutes(other.start_date)
+        week_divisor = MINUTES_PER_WEEK * math.gcd(self.every_weeks, other.every_weeks)
+        offset = (start_minute - other_start_minute) % week_divisor
+        if offset >= other.duration // ONE_MINUTE:
+            offset -= week_divisor
+            if offset <= -(self.duration // ONE_MINUTE):
+                return None
+        overlap_minute = first_common_term(
+            [
+                (start_minute, self.every_weeks * MINUTES_PER_WEEK),
+                (other_start_minute + offset, other.every_weeks * MINUTES_PER_WEEK),
+            ],
+            max(
+                to_epoch_minutes(start_date),
+                start_minute,
+                other_start_minute + offset,
+            ),
+        )
+        if (
+            overlap_minute is None
+            or overlap_minute > self.last_start_minute()
+            or overlap_minute - offset > other.last_start_minute()
+        ):
+            return None
+        return from_epoch_minutes(overlap_minute)
+
+    def first_common_week(
+        self, others: Sequence["RecurringReservation"], start_date: datetime
+    ) -> Optional[datetime]:
+        recurring_reservations = [self, *others]
+        common_week = first_common_term(
+            [
+                (
+                    week_number(recurring_reservation.start_date),
+                    recurring_reservation.every_weeks,
+                )
+                for recurring_reservation in recurring_reservations
+            ],
+            max(
+                week_number(start_date),
+                *(
+                    week_number(recurring_reservation.start_date)
+                    for recurring_reservation in recurring_reservations
+                ),
+            ),
+        )
+        if common_week is None:
+            return None
+        for recurring_reservation in recurring_reservations:
+            if (
+                recurring_reservation.start_minute_in_week(common_week)
+                > recurring_reservation.last_start_minute()
+            ):
+                return None
+        return from_epoch_minutes(self.start_minute_in_week(common_week))
+
+    def start_minute_in_week(self, week: int) -> int:
+        return (
+            to_epoch_minutes(self.start_date)
+            + (week - week_number(self.start_date)) * MINUTES_PER_WEEK
+        )
+
+    def last_start_minute(self) -> int:
+        if self.until is not None:
+            return to_epoch_minutes(self.until)
+        return LAST_MINUTE - self.duration // ONE_MINUTE
+
+    def to_row(self) -> dict[str, Any]:
+        return {
+            "name": self.full_name,
+            "start_time": format_datetime(self.start_date),
+            "end_time": format_datetime(self.end_date),
+            "court": self.court,
+            "every_weeks": self.every_weeks,
+            "until": format_datetime(self.until) if self.until is not None else "",
+            "exceptions": EXCEPTIONS_SEPARATOR.join(
+                format_datetime(exception) for exception in sorted(self.exceptions)
+            ),
+        }
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> "RecurringReservation":
+        return cls(
+            full_name=row["name"],
+            start_date=parse_datetime(row["start_time"]),
+            end_date=parse_datetime(row["end_time"]),
+            court=int(row.get("court") or DEFAULT_COURT),
+            every_weeks=int(row["every_weeks"]),
+            until=parse_datetime(row["until"]) if row.get("until") else None,
+            exceptions=(
+                parse_datetime(exception)
+                for exception in (row.get("exceptions") or "").split(
+                    EXCEPTIONS_SEPARATOR
+                )
+                if exception
+            ),
+        )
+
+
+def week_number(date: datetime) -> int:
+    return (date.toordinal() - 1) // 7
+
+
+def first_common_term(
+    progressions: Iterable[tuple[int, int]], lower_bound: int
+) -> Optional[int]:
+    first, period = 0, 1
+    for other_first, other_period in progressions:
+        divisor = math.gcd(period, other_period)
+        if (other_first - first) % divisor:
+            return None
+        reduced_period = other_period // divisor
+        steps = (
+            (other_first - first)
+            // divisor
+            * pow(period // divisor, -1, reduced_period)
+            % reduced_period
+        )
+        first += period * steps
+        period *= reduced_period
+    return lower_bound + (first - lower_bound) % period
@@ -1,19 +1,84 @@
 from datetime import datetime
+from functools import total_ordering
 
-from reservation_system.configuration import DATETIME_FORMAT
+from reservation_system.configuration import (
+    COURT_CLOSE,
+    COURT_CLOSE_TIME,
+    COURT_OPEN,
+    COURT_OPEN_TIME,
+    DEFAULT_COURT,
+    MAX_SESSION_DURATION,
+    MIN_SESSION_DURATION,
+    NUMBER_OF_COURTS,
+)
+from reservation_system.datetime_utils import ONE_MINUTE, format_datetime
+from reservation_system.errors import CourtIsClosed, WrongSessionDuration
 
 
+@total_ordering
 class Reservation:
+    __slots__ = ("full_name", "start_date", "end_date", "court")
+
     def __init__(
-        self, full_name: str, start_date: datetime, end_date: datetime
+        self,
+        full_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        court: int = DEFAULT_COURT,
     ) -> None:
         self.full_name = full_name
         self.start_date = start_date
         self.end_date = end_date
+        self.court = court
 
     def __str__(self) -> str:
-        return (
+        return self.describe(show_court=NUMBER_OF_COURTS > 1)
+
+    def describe(self, show_court: bool) -> str:
+        description = (
             f"* {self.full_name} "
-            f"{self.start_date.strftime(DATETIME_FORMAT)} - "
-            f"{self.end_date.strftime(DATETIME_FORMAT)} "
+            f"{format_datetime(self.start_date)} - "
+            f"{format_datetime(self.end_date)} "
+        )
+        if show_court:
+            description += f"(court {self.court}) "
+        return description
+
+    def __repr__(self) -> str:
+        return (
+            f"Reservation({self.full_name!r}, {self.start_date!r}, "
+            f"{self.end_date!r}, {self.court!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Reservation):
+            return NotImplemented
+        return self.sort_key() == other.sort_key()
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Reservation):
+            return NotImplemented
+        return self.sort_key() < other.sort_key()
+
+    def __hash__(self) -> int:
+        return hash(self.sort_key())
+
+    def sort_key(self) -> tuple[datetime, datetime, str, int]:
+        return self.start_date, self.end_date, self.full_name, self.court
+
+
+def validate_interval(start_date: datetime, end_date: datetime) -> None:
+    if end_date <= start_date:
+        raise WrongSessionDuration("the reservation ends before it starts")
+    if (
+        start_date.date() != end_date.date()
+        or start_date.time() < COURT_OPEN_TIME
+        or end_date.time() > COURT_CLOSE_TIME
+    ):
+        raise CourtIsClosed(f"the court is open from {COURT_OPEN} to {COURT_CLOSE}")
+    duration = (end_date - start_date) // ONE_MINUTE
+    if not MIN_SESSION_DURATION <= duration <= MAX_SESSION_DURATION:
+        raise WrongSessionDuration(
+            f"the reservation lasts {duration} minutes, sessions last from "
+            f"{MIN_SESSION_DURATION} to {MAX_SESSION_DURATION} minutes"
         )
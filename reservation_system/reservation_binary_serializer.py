@@ -0,0 +1,227 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional
+
+from reservation_system.columnar_reservation_store import ColumnarReservationStore
+from reservation_system.configuration import DEFAULT_COURT
+from reservation_system.datetime_utils import from_epoch_minutes, to_epoch_minutes
+from reservation_system.errors import WrongDataFormat
+from reservation_system.recurring_reservation import RecurringReservation
+from reservation_system.reservation import Reservation
+
+SNAPSHOT_MAGIC = b"RSVS"
+SNAPSHOT_VERSION = 3
+SNAPSHOT_VERSIONS_WITH_COURTS = (2, 3)
+SNAPSHOT_VERSIONS_WITH_RECURRING = (3,)
+SNAPSHOT_HEADER = struct.Struct("<4sIqq")
+RECURRING_HEADER = struct.Struct("<q")
+
+
+class SnapshotColumns:
+    def __init__(
+        self,
+        start_minutes: memoryview,
+        end_minutes: memoryview,
+        name_ids: memoryview,
+        courts: Optional[memoryview],
+        names: list[str],
+        recurring_rows: list[dict[str, Any]],
+    ) -> None:
+        self.start_minutes = start_minutes
+        self.end_minutes = end_minutes
+        self.name_ids = name_ids
+        self.courts = courts
+        self.names = names
+        self.recurring_rows = recurring_rows
+
+    def court_of(self, position: int) -> int:
+        if self.courts is None:
+            return DEFAULT_COURT
+        return self.courts[position]
+
+    def court_blocks(self) -> Iterator[tuple[int, int, int]]:
+        if self.courts is None:
+            yield DEFAULT_COURT, 0, len(self.start_minutes)
+            return
+        position = 0
+        while position < len(self.courts):
+            court = self.courts[position]
+            block_end = bisect_right(self.courts, court, lo=position)
+            yield court, position, block_end
+            position = block_end
+
+    def release(self) -> None:
+        self.start_minutes.release()
+        self.end_minutes.release()
+        self.name_ids.release()
+        if self.courts is not None:
+            self.courts.release()
+
+
+class ReservationBinarySerializer:
+    def __init__(self, file_name: str) -> None:
+        self.file_name = file_name
+
+    def save_reservations(
+        self,
+        reservations: Iterable[Reservation],
+        recurring_reservations: Iterable[RecurringReservation] = (),
+    ) -> None:
+        rows = sorted(
+            (
+                reservation.court,
+                to_epoch_minutes(reservation.start_date),
+                to_epoch_minutes(reservation.end_date),
+                reservation.full_name,
+            )
+            for reservation in reservations
+        )
+        name_ids: dict[str, int] = {}
+        start_minutes = array("q", (row[1] for row in rows))
+        end_minutes = array("q", (row[2] for row in rows))
+        name_id_column = array(
+            "i", (name_ids.setdefault(row[3], len(name_ids)) for row in rows)
+        )
+        court_column = array("i", (row[0] for row in rows))
+        encoded_names = [name.encode("utf8") for name in name_ids]
+        name_offsets = array("q", [0])
+        for encoded_name in encoded_names:
+            name_offsets.append(name_offsets[-1] + len(encoded_name))
+        encoded_recurring_reservations = json.dumps(
+            [
+                recurring_reservation.to_row()
+                for recurring_reservation in recurring_reservations
+            ],
+            ensure_ascii=False,
+        ).encode("utf8")
+
+        with open(self.file_name, mode="wb") as snapshot_file:
+            snapshot_file.write(
+                SNAPSHOT_HEADER.pack(
+                    SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(rows), len(encoded_names)
+                )
+            )
+            snapshot_file.write(start_minutes.tobytes())
+            snapshot_file.write(end_minutes.tobytes())
+            snapshot_file.write(name_id_column.tobytes())
+            snapshot_file.write(court_column.tobytes())
+            snapshot_file.write(name_offsets.tobytes())
+            snapshot_file.write(b"".join(encoded_names))
+            snapshot_file.write(
+                RECURRING_HEADER.pack(len(encoded_recurring_reservations))
+            )
+            snapshot_file.write(encoded_recurring_reservations)
+
+    def load_reservations(self) -> list[Reservation]:
+        return list(self.iter_reservations())
+
+    def iter_reservations(self) -> Iterator[Reservation]:
+        with self.open_columns() as columns:
+            for position, (start_minute, end_minute, name_id) in enumerate(
+                zip(columns.start_minutes, columns.end_minutes, columns.name_ids)
+            ):
+                yield Reservation(
+                    columns.names[name_id],
+                    from_epoch_minutes(start_minute),
+                    from_epoch_minutes(end_minute),
+                    columns.court_of(position),
+                )
+
+    def iter_recurring_reservations(self) -> Iterator[RecurringReservation]:
+        with self.open_columns() as columns:
+            recurring_rows = columns.recurring_rows
+        for row in recurring_rows:
+            yield RecurringReservation.from_row(row)
+
+    def load_columnar_stores(self) -> dict[int, ColumnarReservationStore]:
+        with self.open_columns() as columns:
+            return {
+                court: ColumnarReservationStore.from_columns(
+                    columns.start_minutes[block_start:block_end],
+                    columns.end_minutes[block_start:block_end],
+                    columns.name_ids[block_start:block_end],
+                    columns.names,
+                    court,
+                )
+                for court, block_start, block_end in columns.court_blocks()
+            }
+
+    @contextmanager
+    def open_columns(self) -> Iterator[SnapshotColumns]:
+        with open(self.file_name, mode="rb") as snapshot_file:
+            if os.fstat(snapshot_file.fileno()).st_size == 0:
+                raise WrongDataFormat(f"{self.file_name} is empty.")
+            with mmap.mmap(
+                snapshot_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as snapshot:
+                with memoryview(snapshot) as view:
+                    columns = self._read_columns(view)
+                    try:
+                        yield columns
+                    finally:
+                        columns.release()
+
+    def _read_columns(self, view: memoryview) -> SnapshotColumns:
+        if len(view) < SNAPSHOT_HEADER.size:
+            raise WrongDataFormat(f"{self.file_name} is not a reservation snapshot.")
+        magic, version, count, name_count = SNAPSHOT_HEADER.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC or version not in (
+            1,
+            *SNAPSHOT_VERSIONS_WITH_COURTS,
+            *SNAPSHOT_VERSIONS_WITH_RECURRING,
+        ):
+            raise WrongDataFormat(f"{self.file_name} is not a reservation snapshot.")
+        has_courts = version in SNAPSHOT_VERSIONS_WITH_COURTS
+        int_columns_size = 4 * count * (2 if has_courts else 1)
+        position = SNAPSHOT_HEADER.size
+        names_position = (
+            position
+            + 16 * count
+            + int_columns_size
+            + self._padding(int_columns_size)
+            + 8 * (name_count + 1)
+        )
+        if names_position > len(view):
+            raise WrongDataFormat(f"{self.file_name} is truncated.")
+        start_minutes = view[position : position + 8 * count].cast("q")
+        position += 8 * count
+        end_minutes = view[position : position + 8 * count].cast("q")
+        position += 8 * count
+        name_ids = view[position : position + 4 * count].cast("i")
+        position += 4 * count
+        courts = None
+        if has_courts:
+            courts = view[position : position + 4 * count].cast("i")
+            position += 4 * count
+        position += self._padding(int_columns_size)
+        name_offsets = view[position : position + 8 * (name_count + 1)].cast("q")
+        position += 8 * (name_count + 1)
+        names = [
+            str(view[position + start : position + end], "utf8")
+            for start, end in zip(name_offsets, name_offsets[1:])
+        ]
+        position += name_offsets[-1]
+        name_offsets.release()
+        recurring_rows = []
+        if version in SNAPSHOT_VERSIONS_WITH_RECURRING:
+            if position + RECURRING_HEADER.size > len(view):
+                raise WrongDataFormat(f"{self.file_name} is truncated.")
+            (recurring_size,) = RECURRING_HEADER.unpack_from(view, position)
+            position += RECURRING_HEADER.size
+            if position + recurring_size > len(view):
+                raise WrongDataFormat(f"{self.file_name} is truncated.")
+            recurring_rows = json.loads(
+                str(view[position : position + recurring_size], "utf8")
+            )
+        return SnapshotColumns(
+            start_minutes, end_minutes, name_ids, courts, names, recurring_rows
+        )
+
+    @staticmethod
+    def _padding(size: int) -> int:
+        return -size % 8
@@ -1,37 +1,64 @@
 import csv
-from datetime import datetime
-from reservation_system.configuration import DATETIME_FORMAT
+import sys
+from typing import Iterable, Iterator
+
+from reservation_system.configuration import DEFAULT_COURT
+from reservation_system.datetime_utils import format_datetime, parse_datetime
+from reservation_system.file_utils import open_text_for_reading, open_text_for_writing
+from reservation_system.recurring_reservation import (
+    RECURRING_FIELDS,
+    RecurringReservation,
+)
 from reservation_system.reservation import Reservation
 
+HEADERS = ["name", "start_time", "end_time", "court", *RECURRING_FIELDS]
+
 
 class ReservationCSVSerializer:
     def __init__(self, file_name: str) -> None:
         self.file_name = file_name
 
-    def save_reservations(self, reservations: list[Reservation]) -> None:
-        with open(self.file_name, mode="w", newline="") as reservations_file:
-            headers = ["name", "start_time", "end_time"]
-            writer = csv.DictWriter(reservations_file, fieldnames=headers)
-            writer.writeheader()
-            for reservation in reservations:
-                start_date = reservation.start_date
-                writer.writerow(
-                    {
-                        "name": reservation.full_name,
-                        "start_time": start_date.strftime(DATETIME_FORMAT),
-                        "end_time": reservation.end_date.strftime(DATETIME_FORMAT),
-                    }
-                )
+    def save_reservations(
+        self,
+        reservations: Iterable[Reservation],
+        recurring_reservations: Iterable[RecurringReservation] = (),
+    ) -> None:
+        no_recurrence = [""] * len(RECURRING_FIELDS)
+        with open_text_for_writing(self.file_name, newline="") as reservations_file:
+            writer = csv.writer(reservations_file)
+            writer.writerow(HEADERS)
+            writer.writerows(
+                [
+                    reservation.full_name,
+                    format_datetime(reservation.start_date),
+                    format_datetime(reservation.end_date),
+                    reservation.court,
+                    *no_recurrence,
+                ]
+                for reservation in reservations
+            )
+            for recurring_reservation in recurring_reservations:
+                row = recurring_reservation.to_row()
+                writer.writerow([row[header] for header in HEADERS])
 
     def load_reservations(self) -> list[Reservation]:
-        with open(self.file_name, newline="") as reservations_file:
+        return list(self.iter_reservations())
+
+    def iter_reservations(self) -> Iterator[Reservation]:
+        with open_text_for_reading(self.file_name, newline="") as reservations_file:
             csv_reader = csv.DictReader(reservations_file)
-            reservations = [
-                Reservation(
-                    full_name=row["name"],
-                    start_date=datetime.strptime(row["start_time"], DATETIME_FORMAT),
-                    end_date=datetime.strptime(row["end_time"], DATETIME_FORMAT),
+            for row in csv_reader:
+                if row.get("every_weeks"):
+                    continue
+                yield Reservation(
+                    full_name=sys.intern(row["name"]),
+                    start_date=parse_datetime(row["start_time"]),
+                    end_date=parse_datetime(row["end_time"]),
+                    court=int(row.get("court") or DEFAULT_COURT),
                 )
-                for row in csv_reader
-            ]
-            return reservations
+
+    def iter_recurring_reservations(self) -> Iterator[RecurringReservation]:
+        with open_text_for_reading(self.file_name, newline="") as reservations_file:
+            for row in csv.DictReader(reservations_file):
+                if row.get("every_weeks"):
+                    yield RecurringReservation.from_row(row)
@@ -0,0 +1,104 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional
+
+from reservation_system.datetime_utils import to_epoch_minutes
+from reservation_system.reservation import Reservation
+
+
+class ReservationIndex:
+    def __init__(self, reservations: Iterable[Reservation] = ()) -> None:
+        self._reservations: list[Reservation] = list(reservations)
+        self._start_dates: list[datetime] = []
+        self._max_duration = timedelta(0)
+        self.sort()
+
+    def append(self, reservation: Reservation) -> None:
+        self._reservations.append(reservation)
+
+    def sort(self) -> None:
+        self._reservations.sort(key=lambda reservation: reservation.start_date)
+        self._start_dates = [
+            reservation.start_date for reservation in self._reservations
+        ]
+        self._max_duration = max(
+            (
+                reservation.end_date - reservation.start_date
+                for reservation in self._reservations
+            ),
+            default=timedelta(0),
+        )
+
+    def __len__(self) -> int:
+        return len(self._reservations)
+
+    def __iter__(self) -> Iterator[Reservation]:
+        return iter(self._reservations)
+
+    def iter_user_entries(self) -> Iterator[tuple[str, int, int]]:
+        for reservation in self._reservations:
+            yield (
+                reservation.full_name,
+                to_epoch_minutes(reservation.start_date),
+                reservation.court,
+            )
+
+    def last_start_date(self) -> Optional[datetime]:
+        return self._start_dates[-1] if self._start_dates else None
+
+    def add(self, reservation: Reservation) -> None:
+        position = bisect_right(self._start_dates, reservation.start_date)
+        self._start_dates.insert(position, reservation.start_date)
+        self._reservations.insert(position, reservation)
+        duration = reservation.end_date - reservation.start_date
+        if duration > self._max_duration:
+            self._max_duration = duration
+
+    def remove(self, reservation: Reservation) -> None:
+        position = bisect_left(self._start_dates, reservation.start_date)
+        while (
+            position < len(self._reservations)
+            and self._start_dates[position] == reservation.start_date
+        ):
+            if self._reservations[position] == reservation:
+                del self._start_dates[position]
+                del self._reservations[position]
+                return
+            position += 1
+        raise ValueError("Reservation is not in the index.")
+
+    def find_by_start_date(self, start_date: datetime) -> list[Reservation]:
+        first = bisect_left(self._start_dates, start_date)
+        last = bisect_right(self._start_dates, start_date, lo=first)
+        return self._reservations[first:last]
+
+    def starting_between(
+        self, start_date: datetime, end_date: datetime, limit: int
+    ) -> list[Reservation]:
+        first = bisect_left(self._start_dates, start_date)
+        last = bisect_left(self._start_dates, end_date, lo=first)
+        if last - first > limit:
+            last = bisect_right(
+                self._start_dates, self._start_dates[first + limit - 1], lo=first
+            )
+        return self._reservations[first:last]
+
+    def iter_overlapping(
+        self, start_date: datetime, end_date: datetime
+    ) -> Iterator[Reservation]:
+        first = bisect_right(self._start_dates, start_date - self._max_duration)
+        last = bisect_left(self._start_dates, end_date, lo=first)
+        for position in range(first, last):
+            reservation = self._reservations[position]
+            if reservation.end_date > start_date:
+                yield reservation
+
+    def overlapping(
+        self, start_date: datetime, end_date: datetime
+    ) -> list[Reservation]:
+        return list(self.iter_overlapping(start_date, end_date))
+
+    def first_overlapping(
+        self, start_date: datetime, end_date: datetime
+    ) -> Optional[Reservation]:
+        return next(self.iter_overlapping(start_date, end_date), None)
@@ -0,0 +1,124 @@
+import json
+import os
+import time
+from typing import Any, Iterator, Union
+
+from reservation_system.configuration import (
+    DEFAULT_COURT,
+    JOURNAL_SYNC_EVERY,
+    JOURNAL_SYNC_INTERVAL_SECONDS,
+)
+from reservation_system.const import JournalEvent
+from reservation_system.datetime_utils import format_datetime, parse_datetime
+from reservation_system.recurring_reservation import RecurringReservation
+from reservation_system.reservation import Reservation
+
+TAIL_READ_SIZE = 64 * 1024
+RECURRING_EVENTS = (JournalEvent.RECURRING, JournalEvent.CANCEL_RECURRING)
+
+JournalEntry = Union[Reservation, RecurringReservation]
+
+
+class ReservationJournal:
+    def __init__(
+        self,
+        file_name: str,
+        sync_every: int = JOURNAL_SYNC_EVERY,
+        sync_interval: float = JOURNAL_SYNC_INTERVAL_SECONDS,
+        events_written: int = 0,
+    ) -> None:
+        self.file_name = file_name
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._drop_torn_tail()
+        self.journal_file = open(file_name, mode="a", encoding="utf8")
+        self.events_written = events_written
+        self.unsynced_events = 0
+        self.last_sync = time.monotonic()
+
+    def record_make(self, reservation: Reservation) -> None:
+        self._append(JournalEvent.MAKE, reservation)
+
+    def record_cancel(self, reservation: Reservation) -> None:
+        self._append(JournalEvent.CANCEL, reservation)
+
+    def record_recurring(self, recurring_reservation: RecurringReservation) -> None:
+        self._append_row(
+            {"event": JournalEvent.RECURRING, **recurring_reservation.to_row()}
+        )
+
+    def record_cancel_recurring(
+        self, recurring_reservation: RecurringReservation
+    ) -> None:
+        self._append_row(
+            {"event": JournalEvent.CANCEL_RECURRING, **recurring_reservation.to_row()}
+        )
+
+    def sync(self) -> None:
+        self.journal_file.flush()
+        os.fsync(self.journal_file.fileno())
+        self.unsynced_events = 0
+        self.last_sync = time.monotonic()
+
+    def truncate(self) -> None:
+        self.journal_file.truncate(0)
+        self.sync()
+        self.events_written = 0
+
+    def close(self) -> None:
+        self.sync()
+        self.journal_file.close()
+
+    def _append(self, event: str, reservation: Reservation) -> None:
+        self._append_row(
+            {
+                "event": event,
+                "name": reservation.full_name,
+                "start_time": format_datetime(reservation.start_date),
+                "end_time": format_datetime(reservation.end_date),
+                "court": reservation.court,
+            }
+        )
+
+    def _append_row(self, row: dict[str, Any]) -> None:
+        self.journal_file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self.journal_file.flush()
+        self.events_written += 1
+        self.unsynced_events += 1
+        if (
+            self.unsynced_events >= self.sync_every
+            or time.monotonic() - self.last_sync >= self.sync_interval
+        ):
+            self.sync()
+
+    def _drop_torn_tail(self) -> None:
+        if not os.path.exists(self.file_name):
+            return
+        with open(self.file_name, mode="rb+") as journal_file:
+            size = journal_file.seek(0, os.SEEK_END)
+            tail_start = max(size - TAIL_READ_SIZE, 0)
+            journal_file.seek(tail_start)
+            tail = journal_file.read()
+            if tail.endswith(b"\n") or not tail:
+                return
+            journal_file.truncate(tail_start + tail.rfind(b"\n") + 1)
+
+    @staticmethod
+    def replay(file_name: str) -> Iterator[tuple[str, JournalEntry]]:
+        if not os.path.exists(file_name):
+            return
+        with open(file_name, mode="r", encoding="utf8") as journal_file:
+            for line in journal_file:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    return
+                if row["event"] in RECURRING_EVENTS:
+                    yield row["event"], RecurringReservation.from_row(row)
+                    continue
+                yield row["event"], Reservation(
+                    full_name=row["name"],
+                    start_date=parse_datetime(row["start_time"]),
+                    end_date=parse_datetime(row["end_time"]),
+                    court=row.get("court", DEFAULT_COURT),
+                )
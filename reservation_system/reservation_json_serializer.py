@@ -1,39 +1,130 @@
 import json
-from datetime import datetime
+import re
+import sys
+from typing import Any, Iterable, Iterator, TextIO
 
-from reservation_system.configuration import DATETIME_FORMAT
+from reservation_system.configuration import DEFAULT_COURT
+from reservation_system.datetime_utils import format_datetime, parse_datetime
+from reservation_system.file_utils import open_text_for_reading, open_text_for_writing
+from reservation_system.recurring_reservation import RecurringReservation
 from reservation_system.reservation import Reservation
 
+READ_CHUNK_SIZE = 64 * 1024
+JSON_INDENT = 3
+ARRAY_START = r'"{}"\s*:\s*\['
+ARRAY_START_LOOKBEHIND = 256
+ARRAY_SEPARATORS = re.compile(r"[\s,]*")
+
 
 class ReservationJSONSerializer:
-    def __init__(self, file_name: str) -> None:
+    def __init__(self, file_name: str, compact: bool = False) -> None:
         self.file_name = file_name
+        self.compact = compact
+        if compact:
+            self.encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        else:
+            self.encoder = json.JSONEncoder(ensure_ascii=False, indent=JSON_INDENT)
+
+    def save_reservations(
+        self,
+        reservations: Iterable[Reservation],
+        recurring_reservations: Iterable[RecurringReservation] = (),
+    ) -> None:
+        with open_text_for_writing(self.file_name) as reservations_file:
+            reservations_file.write("{")
+            self._write_array(
+                reservations_file,
+                "recurring_reservations",
+                (
+                    recurring_reservation.to_row()
+                    for recurring_reservation in recurring_reservations
+                ),
+            )
+            reservations_file.write(",")
+            self._write_array(
+                reservations_file,
+                "reservations",
+                (
+                    {
+                        "name": reservation.full_name,
+                        "start_time": format_datetime(reservation.start_date),
+                        "end_time": format_datetime(reservation.end_date),
+                        "court": reservation.court,
+                    }
+                    for reservation in reservations
+                ),
+            )
+            reservations_file.write("}" if self.compact else "\n}")
 
-    def save_reservations(self, reservations: list[Reservation]) -> None:
-        reservations_data = {
-            "reservations": [
-                {
-                    "name": reservation.full_name,
-                    "start_time": reservation.start_date.strftime(DATETIME_FORMAT),
-                    "end_time": reservation.end_date.strftime(DATETIME_FORMAT),
-                }
-                for reservation in reservations
-            ]
-        }
-        with open(self.file_name, mode="w", encoding="utf8") as reservations_file:
-            json.dump(
-                reservations_data, reservations_file, ensure_ascii=False, indent=3
+    def _write_array(
+        self, reservations_file: TextIO, name: str, rows: Iterable[dict[str, Any]]
+    ) -> None:
+        if self.compact:
+            array_indent = row_indent = ""
+            reservations_file.write(f'"{name}":[')
+        else:
+            array_indent = "\n" + " " * JSON_INDENT
+            row_indent = array_indent + " " * JSON_INDENT
+            reservations_file.write(f'{array_indent}"{name}": [')
+        separator = row_indent
+        for row in rows:
+            reservations_file.write(
+                separator + self.encoder.encode(row).replace("\n", row_indent)
             )
+            separator = "," + row_indent
+        if separator != row_indent:
+            reservations_file.write(array_indent)
+        reservations_file.write("]")
 
     def load_reservations(self) -> list[Reservation]:
-        with open(self.file_name, mode="r") as reservations_file:
-            reservations_data = json.load(reservations_file).get("reservations", [])
-            reservations = [
-                Reservation(
-                    full_name=row["name"],
-                    start_date=datetime.strptime(row["start_time"], DATETIME_FORMAT),
-                    end_date=datetime.strptime(row["end_time"], DATETIME_FORMAT),
-                )
-                for row in reservations_data
-            ]
-            return reservations
+        return list(self.iter_reservations())
+
+    def iter_reservations(self) -> Iterator[Reservation]:
+        for row in self.iter_rows():
+            yield Reservation(
+                full_name=sys.intern(row["name"]),
+                start_date=parse_datetime(row["start_time"]),
+                end_date=parse_datetime(row["end_time"]),
+                court=int(row.get("court", DEFAULT_COURT)),
+            )
+
+    def iter_recurring_reservations(self) -> Iterator[RecurringReservation]:
+        for row in self.iter_rows("recurring_reservations"):
+            yield RecurringReservation.from_row(row)
+
+    def iter_rows(self, array_name: str = "reservations") -> Iterator[dict[str, Any]]:
+        decoder = json.JSONDecoder()
+        array_start_pattern = re.compile(ARRAY_START.format(array_name))
+        with open_text_for_reading(self.file_name) as reservations_file:
+            buffer = ""
+            array_start = None
+            while array_start is None:
+                chunk = reservations_file.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    return
+                buffer = buffer[-ARRAY_START_LOOKBEHIND:] + chunk
+                array_start = array_start_pattern.search(buffer)
+            position = array_start.end()
+            while True:
+                separators = ARRAY_SEPARATORS.match(buffer, position)
+                if separators is not None:
+                    position = separators.end()
+                if position < len(buffer) and buffer[position] == "]":
+                    return
+                try:
+                    if position == len(buffer):
+                        raise json.JSONDecodeError(
+                            "Unterminated reservations array", buffer, position
+                        )
+                    row, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    chunk = reservations_file.read(READ_CHUNK_SIZE)
+                    if not chunk:
+                        raise
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+                yield row
+                if position > READ_CHUNK_SIZE:
+                    buffer = buffer[position:]
+                    position = 0
@@ -1,145 +1,1202 @@
-from datetime import timedelta, datetime
-from typing import Optional, Union
+import heapq
+import os
+import sys
+import threading
+from collections import Counter
+from datetime import date, timedelta, datetime
+from itertools import chain, combinations, islice, repeat
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Union
 
-from reservation_system.configuration import COURT_CLOSE, TIME_FORMAT, COURT_OPEN
-from reservation_system.const import FileType
+from reservation_system.bulk_result import BulkResult
+from reservation_system.columnar_reservation_store import ColumnarReservationStore
+from reservation_system.configuration import (
+    COURT_CLOSE_TIME,
+    COURT_OPEN_TIME,
+    MAX_FULL_WEEKS_SKIPPED,
+    MAX_RESERVATIONS_PER_WEEK,
+    MIN_SESSION_DURATION,
+    JOURNAL_COMPACT_EVERY,
+    RANGE_CHUNK_SIZE,
+    NUMBER_OF_COURTS,
+    DEFAULT_COURT,
+    METRICS_ENABLED,
+    UPCOMING_RESERVATIONS_LIMIT,
+)
+from reservation_system.const import FileType, JournalEvent
+from reservation_system.datetime_utils import iso_week
 from reservation_system.errors import (
     SlotUnavailable,
     LessThanHour,
     CourtIsClosed,
     ReservationNoExist,
     TooManyReservations,
+    CourtNoExist,
+    WrongSessionDuration,
+)
+from reservation_system.locks import KeyedLocks, SharedExclusiveLock
+from reservation_system.metrics import Metrics, instrumented, instrumented_stream
+from reservation_system.occupancy_bitmap import DayMasks, OccupancyBitmaps
+from reservation_system.recurring_reservation import RecurringReservation
+from reservation_system.reservation import Reservation, validate_interval
+from reservation_system.reservation_binary_serializer import (
+    ReservationBinarySerializer,
 )
-from reservation_system.reservation import Reservation
-from reservation_system.reservation_csv_serializer import ReservationCSVSerializer
-from reservation_system.reservation_json_serializer import ReservationJSONSerializer
+from reservation_system.reservation_index import ReservationIndex
+from reservation_system.reservation_journal import ReservationJournal
+from reservation_system.user_reservation_index import UserReservationIndex
+
+if TYPE_CHECKING:
+    from reservation_system.import_report import ImportReport
+    from reservation_system.parallel_import import ParsedReservations
+    from reservation_system.reservation_csv_serializer import (
+        ReservationCSVSerializer,
+    )
+    from reservation_system.reservation_json_serializer import (
+        ReservationJSONSerializer,
+    )
 
-Serializer = Union[ReservationCSVSerializer, ReservationJSONSerializer]
+Serializer = Union[
+    "ReservationCSVSerializer", "ReservationJSONSerializer", ReservationBinarySerializer
+]
+ReservationStorage = Union[ReservationIndex, ColumnarReservationStore]
+WeekKey = tuple[str, int, int]
+Cancellation = tuple[str, datetime, Optional[int]]
+ScheduleEntry = Union[Reservation, RecurringReservation]
+
+ONE_WEEK = timedelta(weeks=1)
 
 
 class ReservationManager:
-    def __init__(self) -> None:
-        self.reservations: list[Reservation] = []
+    def __init__(
+        self,
+        columnar: bool = False,
+        courts: Optional[Iterable[int]] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self.columnar = columnar
+        self.metrics = metrics if metrics is not None else Metrics(METRICS_ENABLED)
+        if courts is None:
+            courts = range(1, NUMBER_OF_COURTS + 1)
+        self.courts = list(courts)
+        self.court_reservations: dict[int, ReservationStorage] = {
+            court: self.create_storage(court=court) for court in self.courts
+        }
+        self._user_reservations: Optional[UserReservationIndex] = None
+        self.recurring_reservations: list[RecurringReservation] = []
+        self._user_recurring_reservations: Optional[
+            dict[str, list[RecurringReservation]]
+        ] = None
+        self.weekly_reservations_count: Counter[WeekKey] = Counter()
+        self.counted_weeks: set[tuple[int, int]] = set()
+        self.occupancy = OccupancyBitmaps()
+        self.journal: Optional[ReservationJournal] = None
+        self.snapshot_file: Optional[str] = None
+        self._schedule_lock = SharedExclusiveLock()
+        self._state_lock = threading.RLock()
+        self._user_week_locks = KeyedLocks()
+        self._court_day_locks = KeyedLocks()
+        if self.metrics.enabled:
+            self.metrics.attach(self)
+
+    def enable_metrics(self) -> None:
+        self.metrics.attach(self)
+
+    def disable_metrics(self) -> None:
+        self.metrics.detach(self)
 
+    @instrumented
     def make_a_reservation(
-        self, full_name: str, start_date: datetime, duration: int
+        self,
+        full_name: str,
+        start_date: datetime,
+        duration: int,
+        court: int = DEFAULT_COURT,
     ) -> None:
         end_date = start_date + timedelta(minutes=duration)
         current_time = datetime.today()
-        open_time = datetime.strptime(COURT_OPEN, TIME_FORMAT).time()
-        closed_time = datetime.strptime(COURT_CLOSE, TIME_FORMAT).time()
-
-        present_day_weekday = datetime.today().weekday()
-        monday = datetime.today() - timedelta(days=present_day_weekday)
-        sunday = monday + timedelta(days=6)
-        reservation_in_current_week = self.find_reservation_in_range(monday, sunday)
-
-        how_many_reservations = 0
-        for reservation in reservation_in_current_week:
-            if reservation.full_name == full_name:
-                how_many_reservations += 1
-        court_available = self.is_court_available(start_date, end_date)
-        if start_date.time() < open_time or end_date.time() > closed_time:
-            raise CourtIsClosed()
-        if start_date + timedelta(hours=1) <= current_time:
-            raise LessThanHour()
-        if how_many_reservations >= 2:
-            raise TooManyReservations()
-        if court_available is False:
-            raise SlotUnavailable()
-        reservation = Reservation(full_name, start_date, end_date)
-        self.reservations.append(reservation)
+        validate_interval(start_date, end_date)
+        with self._schedule_lock.shared(), self._user_week_locks.hold(
+            [self.week_key(full_name, start_date)]
+        ), self._court_day_locks.hold([(court, start_date.date())]):
+            how_many_reservations = self.count_weekly_reservations(
+                full_name, start_date
+            )
+            court_available = self.is_court_available(start_date, end_date, court)
+            if start_date + timedelta(hours=1) <= current_time:
+                raise LessThanHour()
+            if how_many_reservations >= MAX_RESERVATIONS_PER_WEEK:
+                raise TooManyReservations()
+            if court_available is False:
+                raise SlotUnavailable()
+            reservation = Reservation(full_name, start_date, end_date, court)
+            self._add_reservation(reservation)
+        self._compact_journal_if_needed()
 
-    def delete_a_reservation(self, full_name: str, start_date: datetime) -> None:
+    def delete_a_reservation(
+        self, full_name: str, start_date: datetime, court: Optional[int] = None
+    ) -> None:
         required_cancellation_time = datetime.today() + timedelta(hours=1)
-        existing_reservation = self.find_client_reservation(full_name, start_date)
-        if existing_reservation is None:
-            raise ReservationNoExist()
-        if required_cancellation_time > start_date:
-            raise LessThanHour()
-        self.reservations.remove(existing_reservation)
-
-    def find_reservation(self, start_date: datetime) -> Optional[Reservation]:
-        for reservation in self.reservations:
-            if reservation.start_date == start_date:
+        courts = self.courts if court is None else [court]
+        with self._schedule_lock.shared(), self._user_week_locks.hold(
+            [self.week_key(full_name, start_date)]
+        ), self._court_day_locks.hold(
+            (locked_court, start_date.date()) for locked_court in courts
+        ):
+            existing_reservation = self.find_client_reservation(
+                full_name, start_date, court
+            )
+            if existing_reservation is None:
+                raise ReservationNoExist()
+            if required_cancellation_time > start_date:
+                raise LessThanHour()
+            self._remove_reservation(existing_reservation)
+        self._compact_journal_if_needed()
+
+    def make_a_recurring_reservation(
+        self,
+        full_name: str,
+        start_date: datetime,
+        duration: int,
+        court: int = DEFAULT_COURT,
+        every_weeks: int = 1,
+        until: Optional[datetime] = None,
+    ) -> RecurringReservation:
+        recurring_reservation = RecurringReservation(
+            full_name,
+            start_date,
+            start_date + timedelta(minutes=duration),
+            court,
+            every_weeks,
+            until,
+        )
+        validate_interval(start_date, recurring_reservation.end_date)
+        with self._schedule_lock.exclusive():
+            self._court_storage(court)
+            if start_date + timedelta(hours=1) <= datetime.today():
+                raise LessThanHour()
+            self._validate_recurring_reservation(
+                recurring_reservation, check_weekly_limit=True
+            )
+            self._add_recurring_reservation(recurring_reservation)
+        self._compact_journal_if_needed()
+        return recurring_reservation
+
+    def cancel_recurring_reservation(
+        self, full_name: str, start_date: datetime, court: Optional[int] = None
+    ) -> None:
+        with self._schedule_lock.exclusive():
+            recurring_reservation = self._find_recurring_reservation(
+                full_name, start_date, court
+            )
+            if recurring_reservation is None:
+                raise ReservationNoExist()
+            if datetime.today() + timedelta(hours=1) > start_date:
+                raise LessThanHour()
+            self._end_recurring_reservation(recurring_reservation, start_date)
+        self._compact_journal_if_needed()
+
+    def _validate_recurring_reservation(
+        self, recurring_reservation: RecurringReservation, check_weekly_limit: bool
+    ) -> None:
+        horizon = self._recurring_check_horizon(recurring_reservation)
+        for occurrence in recurring_reservation.iter_occurrences(
+            recurring_reservation.start_date, horizon
+        ):
+            if (
+                check_weekly_limit
+                and self.count_weekly_reservations(
+                    occurrence.full_name, occurrence.start_date
+                )
+                >= MAX_RESERVATIONS_PER_WEEK
+            ):
+                raise TooManyReservations()
+            if (
+                self._first_overlapping(
+                    occurrence.court, occurrence.start_date, occurrence.end_date
+                )
+                is not None
+            ):
+                raise SlotUnavailable()
+        for other in self._court_recurring_reservations(recurring_reservation.court):
+            if recurring_reservation.first_overlap_with(other, horizon) is not None:
+                raise SlotUnavailable()
+        if not check_weekly_limit:
+            return
+        for others in combinations(
+            self._recurring_reservations_of(recurring_reservation.full_name),
+            MAX_RESERVATIONS_PER_WEEK,
+        ):
+            if recurring_reservation.first_common_week(others, horizon) is not None:
+                raise TooManyReservations()
+
+    def _recurring_check_horizon(
+        self, recurring_reservation: RecurringReservation
+    ) -> datetime:
+        latest_dates = [recurring_reservation.start_date]
+        latest_dates.extend(recurring_reservation.exceptions)
+        for storage in self.court_reservations.values():
+            last_start_date = storage.last_start_date()
+            if last_start_date is not None:
+                latest_dates.append(last_start_date)
+        for other in self.recurring_reservations:
+            latest_dates.append(other.start_date)
+            latest_dates.extend(other.exceptions)
+        latest_date = max(latest_dates)
+        if latest_date >= datetime.max - ONE_WEEK:
+            return datetime.max
+        return latest_date + ONE_WEEK
+
+    def _find_recurring_reservation(
+        self, full_name: str, start_date: datetime, court: Optional[int] = None
+    ) -> Optional[RecurringReservation]:
+        for recurring_reservation in self._recurring_reservations_of(full_name):
+            if (
+                court is None or recurring_reservation.court == court
+            ) and recurring_reservation.occurs_at(start_date):
+                return recurring_reservation
+        return None
+
+    def _add_recurring_reservation(
+        self, recurring_reservation: RecurringReservation
+    ) -> None:
+        with self._state_lock:
+            self.recurring_reservations.append(recurring_reservation)
+            if self.journal is not None:
+                self.journal.record_recurring(recurring_reservation)
+            self._reset_derived_state()
+
+    def _end_recurring_reservation(
+        self, recurring_reservation: RecurringReservation, start_date: datetime
+    ) -> None:
+        with self._state_lock:
+            if start_date <= recurring_reservation.start_date:
+                self.recurring_reservations.remove(recurring_reservation)
+                if self.journal is not None:
+                    self.journal.record_cancel_recurring(recurring_reservation)
+            else:
+                recurring_reservation.until = start_date - timedelta(minutes=1)
+                if self.journal is not None:
+                    self.journal.record_recurring(recurring_reservation)
+            self._reset_derived_state()
+
+    def _skip_recurring_occurrence(self, reservation: Reservation) -> None:
+        with self._state_lock:
+            recurring_reservation = self._find_recurring_reservation(
+                reservation.full_name, reservation.start_date, reservation.court
+            )
+            if recurring_reservation is None:
+                raise ValueError("Reservation is not in the schedule.")
+            recurring_reservation.exceptions.add(reservation.start_date)
+            if self.journal is not None:
+                self.journal.record_recurring(recurring_reservation)
+            self._reset_derived_state()
+
+    def _reset_derived_state(self) -> None:
+        self.weekly_reservations_count = Counter()
+        self.counted_weeks = set()
+        self.occupancy.clear()
+        self._user_recurring_reservations = None
+
+    def _recurring_reservations_of(self, full_name: str) -> list[RecurringReservation]:
+        with self._state_lock:
+            if self._user_recurring_reservations is None:
+                self._user_recurring_reservations = {}
+                for recurring_reservation in self.recurring_reservations:
+                    self._user_recurring_reservations.setdefault(
+                        recurring_reservation.full_name, []
+                    ).append(recurring_reservation)
+            return self._user_recurring_reservations.get(full_name, [])
+
+    def make_reservations_bulk(
+        self, reservations: Iterable[Reservation], atomic: bool = False
+    ) -> list[BulkResult]:
+        current_time = datetime.today()
+        reservations = list(reservations)
+        results = [BulkResult(reservation) for reservation in reservations]
+        with self._schedule_lock.exclusive():
+            last_accepted_end: dict[int, datetime] = {}
+            accepted_per_week: Counter[WeekKey] = Counter()
+            for position in sorted(
+                range(len(reservations)),
+                key=lambda position: (
+                    reservations[position].start_date,
+                    reservations[position].end_date,
+                ),
+            ):
+                reservation = reservations[position]
+                result = results[position]
+                week_key = self.week_key(reservation.full_name, reservation.start_date)
+                try:
+                    self._court_storage(reservation.court)
+                    validate_interval(reservation.start_date, reservation.end_date)
+                    if reservation.start_date + timedelta(hours=1) <= current_time:
+                        raise LessThanHour()
+                    if (
+                        self.count_weekly_reservations(
+                            reservation.full_name, reservation.start_date
+                        )
+                        + accepted_per_week[week_key]
+                        >= MAX_RESERVATIONS_PER_WEEK
+                    ):
+                        raise TooManyReservations()
+                    previous_end = last_accepted_end.get(reservation.court)
+                    if (
+                        previous_end is not None
+                        and reservation.start_date < previous_end
+                    ) or self._first_overlapping(
+                        reservation.court, reservation.start_date, reservation.end_date
+                    ) is not None:
+                        raise SlotUnavailable()
+                except (
+                    CourtNoExist,
+                    CourtIsClosed,
+                    WrongSessionDuration,
+                    LessThanHour,
+                    TooManyReservations,
+                    SlotUnavailable,
+                ) as error:
+                    result.error = error
+                    continue
+                last_accepted_end[reservation.court] = reservation.end_date
+                accepted_per_week[week_key] += 1
+            self._apply_bulk_results(results, atomic, self._add_reservation)
+        self._compact_journal_if_needed()
+        return results
+
+    def delete_reservations_bulk(
+        self, cancellations: Iterable[Cancellation], atomic: bool = False
+    ) -> list[BulkResult]:
+        required_cancellation_time = datetime.today() + timedelta(hours=1)
+        results = []
+        with self._schedule_lock.exclusive():
+            cancelled: set[Reservation] = set()
+            for full_name, start_date, court in cancellations:
+                result = BulkResult(None)
+                results.append(result)
+                try:
+                    result.reservation = self._find_uncancelled_reservation(
+                        full_name, start_date, court, cancelled
+                    )
+                    if result.reservation is None:
+                        raise ReservationNoExist()
+                    if required_cancellation_time > start_date:
+                        raise LessThanHour()
+                except (CourtNoExist, ReservationNoExist, LessThanHour) as error:
+                    result.error = error
+                    continue
+                cancelled.add(result.reservation)
+            self._apply_bulk_results(results, atomic, self._remove_reservation)
+        self._compact_journal_if_needed()
+        return results
+
+    def _find_uncancelled_reservation(
+        self,
+        full_name: str,
+        start_date: datetime,
+        court: Optional[int],
+        cancelled: set[Reservation],
+    ) -> Optional[Reservation]:
+        if court is not None:
+            self._court_storage(court)
+        for reservation in self._find_user_reservations(full_name, start_date, court):
+            if reservation not in cancelled:
+                return reservation
+        recurring_reservation = self._find_recurring_reservation(
+            full_name, start_date, court
+        )
+        if recurring_reservation is not None:
+            reservation = recurring_reservation.occurrence(start_date)
+            if reservation not in cancelled:
                 return reservation
         return None
 
+    @staticmethod
+    def _apply_bulk_results(
+        results: list[BulkResult],
+        atomic: bool,
+        apply: Callable[[Reservation], None],
+    ) -> None:
+        if atomic and not all(result.ok for result in results):
+            return
+        for result in results:
+            if result.ok and result.reservation is not None:
+                apply(result.reservation)
+                result.applied = True
+
+    def _add_reservation(self, reservation: Reservation) -> None:
+        with self._state_lock:
+            self._court_storage(reservation.court, create=True).add(reservation)
+            if self._user_reservations is not None:
+                self._user_reservations.add(reservation)
+            self.occupancy.add(reservation)
+            if self.journal is not None:
+                self.journal.record_make(reservation)
+            if iso_week(reservation.start_date) in self.counted_weeks:
+                self.weekly_reservations_count[
+                    self.week_key(reservation.full_name, reservation.start_date)
+                ] += 1
+
+    def _remove_reservation(self, reservation: Reservation) -> None:
+        with self._state_lock:
+            storage = self.court_reservations[reservation.court]
+            if reservation not in storage.find_by_start_date(reservation.start_date):
+                self._skip_recurring_occurrence(reservation)
+                return
+            storage.remove(reservation)
+            if self._user_reservations is not None:
+                self._user_reservations.remove(reservation)
+            self.occupancy.discard(reservation)
+            if self.journal is not None:
+                self.journal.record_cancel(reservation)
+            if iso_week(reservation.start_date) not in self.counted_weeks:
+                return
+            week_key = self.week_key(reservation.full_name, reservation.start_date)
+            self.weekly_reservations_count[week_key] -= 1
+            if self.weekly_reservations_count[week_key] <= 0:
+                del self.weekly_reservations_count[week_key]
+
+    def count_weekly_reservations(self, full_name: str, start_date: datetime) -> int:
+        week = iso_week(start_date)
+        with self._state_lock:
+            if week not in self.counted_weeks:
+                monday = datetime.fromisocalendar(*week, 1)
+                for reservation in self.find_reservation_in_range(
+                    monday, monday + timedelta(days=7)
+                ):
+                    if iso_week(reservation.start_date) == week:
+                        self.weekly_reservations_count[
+                            self.week_key(reservation.full_name, reservation.start_date)
+                        ] += 1
+                self.counted_weeks.add(week)
+            return self.weekly_reservations_count[self.week_key(full_name, start_date)]
+
+    @staticmethod
+    def week_key(full_name: str, start_date: datetime) -> WeekKey:
+        return full_name, *iso_week(start_date)
+
+    def find_reservation(
+        self, start_date: datetime, court: Optional[int] = None
+    ) -> Optional[Reservation]:
+        with self._state_lock:
+            for storage in self._storages(court):
+                reservations = storage.find_by_start_date(start_date)
+                if reservations:
+                    return reservations[0]
+            for recurring_reservation in self._court_recurring_reservations(court):
+                if recurring_reservation.occurs_at(start_date):
+                    return recurring_reservation.occurrence(start_date)
+        return None
+
     def find_client_reservation(
-        self, full_name: str, start_date: datetime
+        self, full_name: str, start_date: datetime, court: Optional[int] = None
     ) -> Optional[Reservation]:
-        for reservation in self.reservations:
-            if (
-                reservation.full_name == full_name
-                and reservation.start_date == start_date
+        with self._state_lock:
+            if court is not None:
+                self._court_storage(court)
+            reservations = self._find_user_reservations(full_name, start_date, court)
+            if reservations:
+                return reservations[0]
+            recurring_reservation = self._find_recurring_reservation(
+                full_name, start_date, court
+            )
+            if recurring_reservation is not None:
+                return recurring_reservation.occurrence(start_date)
+        return None
+
+    @instrumented
+    def find_upcoming_reservations(
+        self,
+        full_name: str,
+        limit: int = UPCOMING_RESERVATIONS_LIMIT,
+        start_date: Optional[datetime] = None,
+    ) -> list[Reservation]:
+        if start_date is None:
+            start_date = datetime.today()
+        with self._state_lock:
+            user_start_dates = self._user_reservation_index().starting_from(
+                full_name, start_date, limit
+            )
+            upcoming: list[Iterable[Reservation]] = [
+                chain.from_iterable(
+                    self._find_user_reservations(full_name, user_start_date, court)
+                    for user_start_date, court in user_start_dates
+                )
+            ]
+            for recurring_reservation in self._recurring_reservations_of(full_name):
+                upcoming.append(
+                    islice(
+                        (
+                            occurrence
+                            for occurrence in recurring_reservation.iter_occurrences(
+                                start_date, datetime.max
+                            )
+                            if occurrence.start_date >= start_date
+                        ),
+                        limit,
+                    )
+                )
+            reservations = list(
+                islice(
+                    heapq.merge(
+                        *upcoming, key=lambda reservation: reservation.start_date
+                    ),
+                    limit,
+                )
+            )
+        if self.metrics.enabled:
+            self.metrics.add_items(len(reservations))
+        return reservations
+
+    def _find_user_reservations(
+        self, full_name: str, start_date: datetime, court: Optional[int] = None
+    ) -> list[Reservation]:
+        with self._state_lock:
+            return [
+                reservation
+                for user_court in self._user_reservation_index().courts_at(
+                    full_name, start_date, court
+                )
+                for reservation in self.court_reservations[
+                    user_court
+                ].find_by_start_date(start_date)
+                if reservation.full_name == full_name
+            ]
+
+    def _user_reservation_index(self) -> UserReservationIndex:
+        with self._state_lock:
+            if self._user_reservations is None:
+                self._user_reservations = UserReservationIndex(
+                    chain.from_iterable(
+                        storage.iter_user_entries()
+                        for storage in self.court_reservations.values()
+                    )
+                )
+            return self._user_reservations
+
+    def is_court_available(
+        self, start_date: datetime, end_date: datetime, court: int = DEFAULT_COURT
+    ) -> bool:
+        with self._state_lock:
+            self._court_storage(court)
+            query_masks = OccupancyBitmaps.query_masks(start_date, end_date)
+            if query_masks is None:
+                return self._first_overlapping(court, start_date, end_date) is None
+            query_touched, query_full = query_masks
+            touched, full = self._day_masks(court, start_date.date())
+            if query_full & touched:
+                return False
+            query_edges = query_touched & ~query_full
+            if query_edges & full:
+                return False
+            if query_edges & touched:
+                return self._first_overlapping(court, start_date, end_date) is None
+            return True
+
+    def find_free_windows(
+        self, start_date: datetime, end_date: datetime, court: int = DEFAULT_COURT
+    ) -> list[tuple[datetime, datetime]]:
+        free_windows = []
+        for day in OccupancyBitmaps.days_of(start_date, end_date):
+            with self._state_lock:
+                touched, full = self._day_masks(court, day)
+                if touched == full:
+                    day_windows = list(OccupancyBitmaps.free_windows(day, touched))
+                else:
+                    day_windows = self._scan_free_windows(court, day)
+            if day_windows and (
+                day_windows[0][0] < start_date or day_windows[-1][1] > end_date
             ):
+                day_windows = [
+                    (max(window_start, start_date), min(window_end, end_date))
+                    for window_start, window_end in day_windows
+                    if window_start < end_date and window_end > start_date
+                ]
+            free_windows.extend(day_windows)
+        return free_windows
+
+    def _day_masks(self, court: int, day: date) -> DayMasks:
+        with self._state_lock:
+            day_masks = self.occupancy.get(court, day)
+            if day_masks is None:
+                day_open = datetime.combine(day, COURT_OPEN_TIME)
+                day_close = datetime.combine(day, COURT_CLOSE_TIME)
+                day_masks = self.occupancy.build(
+                    court,
+                    day,
+                    chain(
+                        self._court_storage(court).iter_overlapping(
+                            day_open, day_close
+                        ),
+                        *(
+                            recurring_reservation.iter_occurrences(day_open, day_close)
+                            for recurring_reservation in self._court_recurring_reservations(
+                                court
+                            )
+                        ),
+                    ),
+                )
+            return day_masks
+
+    def _scan_free_windows(
+        self, court: int, day: date
+    ) -> list[tuple[datetime, datetime]]:
+        day_open = datetime.combine(day, COURT_OPEN_TIME)
+        day_close = datetime.combine(day, COURT_CLOSE_TIME)
+        free_windows = []
+        window_start = day_open
+        for reservation in self.find_reservation_in_range(day_open, day_close, court):
+            if window_start < reservation.start_date:
+                free_windows.append((window_start, reservation.start_date))
+            window_start = max(window_start, reservation.end_date)
+        if window_start < day_close:
+            free_windows.append((window_start, day_close))
+        return free_windows
+
+    def _first_overlapping(
+        self, court: int, start_date: datetime, end_date: datetime
+    ) -> Optional[Reservation]:
+        with self._state_lock:
+            reservation = self._court_storage(court).first_overlapping(
+                start_date, end_date
+            )
+            if reservation is not None:
                 return reservation
+            for recurring_reservation in self._court_recurring_reservations(court):
+                reservation = recurring_reservation.first_overlapping(
+                    start_date, end_date
+                )
+                if reservation is not None:
+                    return reservation
         return None
 
-    def is_court_available(self, start_date: datetime, end_date: datetime) -> bool:
-        for reservation in self.reservations:
-            if reservation.start_date < end_date and reservation.end_date > start_date:
-                return False
-        return True
+    def _court_recurring_reservations(
+        self, court: Optional[int]
+    ) -> list[RecurringReservation]:
+        return [
+            recurring_reservation
+            for recurring_reservation in self.recurring_reservations
+            if court is None or recurring_reservation.court == court
+        ]
 
+    @instrumented
     def find_reservation_in_range(
-        self, start_date: datetime, end_date: datetime
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        court: Optional[int] = None,
+        expand_recurring: bool = True,
     ) -> list[Reservation]:
-        reservations_in_range = [
-            reservation
-            for reservation in self.reservations
-            if reservation.start_date < end_date and reservation.end_date > start_date
-        ]
-        return reservations_in_range
+        with self._state_lock:
+            court_reservations = [
+                storage.overlapping(start_date, end_date)
+                for storage in self._storages(court)
+            ]
+            recurring_reservations = self._court_recurring_reservations(court)
+            if expand_recurring and recurring_reservations:
+                court_reservations.append(
+                    sorted(
+                        chain.from_iterable(
+                            recurring_reservation.iter_occurrences(start_date, end_date)
+                            for recurring_reservation in recurring_reservations
+                        ),
+                        key=lambda reservation: reservation.start_date,
+                    )
+                )
+        if len(court_reservations) == 1:
+            reservations = court_reservations[0]
+        else:
+            reservations = list(
+                heapq.merge(
+                    *court_reservations, key=lambda reservation: reservation.start_date
+                )
+            )
+        if self.metrics.enabled:
+            self.metrics.add_items(len(reservations))
+        return reservations
 
+    @instrumented_stream
+    def iter_reservation_in_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        court: Optional[int] = None,
+        expand_recurring: bool = True,
+    ) -> Iterator[Reservation]:
+        with self._state_lock:
+            court_reservations: list[Iterator[Reservation]] = [
+                self._iter_storage_range(storage, start_date, end_date)
+                for storage in self._storages(court)
+            ]
+            if expand_recurring:
+                court_reservations.extend(
+                    recurring_reservation.iter_occurrences(start_date, end_date)
+                    for recurring_reservation in self._court_recurring_reservations(
+                        court
+                    )
+                )
+        if len(court_reservations) == 1:
+            return court_reservations[0]
+        return heapq.merge(
+            *court_reservations, key=lambda reservation: reservation.start_date
+        )
+
+    def _iter_storage_range(
+        self, storage: ReservationStorage, start_date: datetime, end_date: datetime
+    ) -> Iterator[Reservation]:
+        with self._state_lock:
+            reservations = storage.overlapping(start_date, start_date)
+        yield from reservations
+        cursor = start_date
+        while True:
+            with self._state_lock:
+                reservations = storage.starting_between(
+                    cursor, end_date, RANGE_CHUNK_SIZE
+                )
+            if not reservations:
+                return
+            yield from reservations
+            cursor = reservations[-1].start_date + timedelta(microseconds=1)
+
+    @instrumented
     def find_nearest_available_slot(
-        self, start_date: datetime, duration: int
+        self, start_date: datetime, duration: int, court: int = DEFAULT_COURT
     ) -> datetime:
-        end_date = start_date + timedelta(minutes=duration)
-        while True:
-            list_of_reservation = self.find_reservation_in_range(start_date, end_date)
-            if not list_of_reservation:
-                return start_date
-            list_of_reservation.sort(key=lambda reservation: reservation.start_date)
-            last_reservation = list_of_reservation[-1]
-            start_date = last_reservation.end_date
-            end_date = start_date + timedelta(minutes=duration)
+        available_slots = self.find_available_slots(start_date, duration, court=court)
+        if not available_slots:
+            raise SlotUnavailable()
+        return available_slots[0]
+
+    @instrumented
+    def find_earliest_available_court(
+        self,
+        start_date: datetime,
+        duration: int,
+        horizon: Optional[timedelta] = None,
+        full_name: Optional[str] = None,
+    ) -> tuple[datetime, int]:
+        court_slots = self.iter_available_court_slots(start_date, duration, horizon)
+        if full_name is not None:
+            court_slots = self._iter_slots_within_weekly_limit(full_name, court_slots)
+        available_slot = next(court_slots, None)
+        if available_slot is None:
+            raise SlotUnavailable()
+        return available_slot
+
+    def _iter_slots_within_weekly_limit(
+        self, full_name: str, court_slots: Iterator[tuple[datetime, int]]
+    ) -> Iterator[tuple[datetime, int]]:
+        skipped_weeks = 0
+        last_skipped_week = None
+        for slot, court in court_slots:
+            if (
+                self.count_weekly_reservations(full_name, slot)
+                < MAX_RESERVATIONS_PER_WEEK
+            ):
+                yield slot, court
+                continue
+            week = iso_week(slot)
+            if week != last_skipped_week:
+                skipped_weeks += 1
+                if skipped_weeks > MAX_FULL_WEEKS_SKIPPED:
+                    return
+                last_skipped_week = week
+
+    def find_available_slots(
+        self,
+        start_date: datetime,
+        duration: int,
+        count: int = 1,
+        horizon: Optional[timedelta] = None,
+        court: int = DEFAULT_COURT,
+    ) -> list[datetime]:
+        return list(
+            islice(
+                self.iter_available_slots(start_date, duration, horizon, court), count
+            )
+        )
+
+    def iter_available_court_slots(
+        self,
+        start_date: datetime,
+        duration: int,
+        horizon: Optional[timedelta] = None,
+    ) -> Iterator[tuple[datetime, int]]:
+        court_slots = heapq.merge(
+            *(
+                zip(
+                    self._iter_slots_and_day_ends(start_date, duration, horizon, court),
+                    repeat(court),
+                )
+                for court in self.courts
+            )
+        )
+        for (slot, is_available), court in court_slots:
+            if is_available:
+                yield slot, court
+
+    def iter_available_slots(
+        self,
+        start_date: datetime,
+        duration: int,
+        horizon: Optional[timedelta] = None,
+        court: int = DEFAULT_COURT,
+    ) -> Iterator[datetime]:
+        for slot, is_available in self._iter_slots_and_day_ends(
+            start_date, duration, horizon, court
+        ):
+            if is_available:
+                yield slot
+
+    def _iter_slots_and_day_ends(
+        self,
+        start_date: datetime,
+        duration: int,
+        horizon: Optional[timedelta],
+        court: int,
+    ) -> Iterator[tuple[datetime, bool]]:
+        self._court_storage(court)
+        slot_duration = timedelta(minutes=duration)
+        step = timedelta(minutes=MIN_SESSION_DURATION)
+        day = start_date.date()
+        if datetime.combine(day, COURT_OPEN_TIME) + slot_duration > datetime.combine(
+            day, COURT_CLOSE_TIME
+        ):
+            return
+        search_end = start_date + horizon if horizon is not None else None
+        candidate = start_date
+        while search_end is None or datetime.combine(day, COURT_OPEN_TIME) < search_end:
+            day_open = datetime.combine(day, COURT_OPEN_TIME)
+            day_close = datetime.combine(day, COURT_CLOSE_TIME)
+            if search_end is not None:
+                day_close = min(day_close, search_end + slot_duration)
+            candidate = max(candidate, day_open)
+            day_reservations = self.find_reservation_in_range(
+                candidate, day_close, court
+            )
+            for reservation in day_reservations:
+                while candidate + slot_duration <= reservation.start_date:
+                    yield candidate, True
+                    candidate += step
+                candidate = max(candidate, reservation.end_date)
+            while candidate + slot_duration <= day_close:
+                yield candidate, True
+                candidate += step
+            day += timedelta(days=1)
+            yield datetime.combine(day, COURT_OPEN_TIME), False
 
     @staticmethod
     def longest_slot_minutes_for_start_date(start_date: datetime) -> int:
-        court_closing_datetime = datetime.strptime(COURT_CLOSE, TIME_FORMAT)
-        start_datetime = court_closing_datetime.replace(
-            hour=start_date.hour, minute=start_date.minute
+        available_minutes = (
+            COURT_CLOSE_TIME.hour * 60
+            + COURT_CLOSE_TIME.minute
+            - start_date.hour * 60
+            - start_date.minute
         )
-        available_slot = court_closing_datetime - start_datetime
-        if available_slot.total_seconds() > 0:
-            return int(available_slot.total_seconds() / 60)
+        if available_minutes > 0:
+            return available_minutes
         return 0
 
+    @instrumented
     def save_reservations_from_range(
         self,
         start_date: datetime,
         end_date: datetime,
         name_of_file: str,
         file_type: str,
+        compact: bool = False,
     ) -> None:
-        reservations_to_save = self.find_reservation_in_range(start_date, end_date)
+        reservations_to_save = self.metrics.count_items(
+            self.iter_reservation_in_range(start_date, end_date, expand_recurring=False)
+        )
+        with self._state_lock:
+            recurring_reservations_to_save = [
+                recurring_reservation
+                for recurring_reservation in self.recurring_reservations
+                if recurring_reservation.first_overlapping(start_date, end_date)
+                is not None
+            ]
+        serializer = self.create_serializer(name_of_file, file_type, compact)
+        serializer.save_reservations(
+            reservations_to_save, recurring_reservations_to_save
+        )
 
-        serializer: Serializer
-        if file_type.upper() == FileType.JSON:
-            serializer = ReservationJSONSerializer(file_name=name_of_file)
-        elif file_type.upper() == FileType.CSV:
-            serializer = ReservationCSVSerializer(file_name=name_of_file)
+    @instrumented
+    def load_reservations_from_file(
+        self, name_of_file: str, file_type: str, merge: bool = False
+    ) -> list[ScheduleEntry]:
+        with self._schedule_lock.exclusive():
+            conflicts = self._load_reservations_from_file(
+                name_of_file, file_type, merge
+            )
+        self._compact_journal_if_needed()
+        return conflicts
+
+    def _load_reservations_from_file(
+        self, name_of_file: str, file_type: str, merge: bool
+    ) -> list[ScheduleEntry]:
+        serializer = self.create_serializer(name_of_file, file_type)
+        if not merge:
+            court_reservations: dict[int, ReservationStorage]
+            if self.columnar and isinstance(serializer, ReservationBinarySerializer):
+                court_reservations = dict(serializer.load_columnar_stores())
+            else:
+                court_reservations = self.create_court_storages(
+                    serializer.iter_reservations()
+                )
+            self._replace_schedule(
+                court_reservations, list(serializer.iter_recurring_reservations())
+            )
+            if self.metrics.enabled:
+                self.metrics.add_items(
+                    sum(len(storage) for storage in court_reservations.values())
+                )
+            self._compact_journal()
+            return []
+        conflicts: list[ScheduleEntry] = []
+        for reservation in self.metrics.count_items(serializer.iter_reservations()):
+            self._court_storage(reservation.court, create=True)
+            if (
+                self._first_overlapping(
+                    reservation.court, reservation.start_date, reservation.end_date
+                )
+                is None
+            ):
+                self._add_reservation(reservation)
+            else:
+                conflicts.append(reservation)
+        for recurring_reservation in serializer.iter_recurring_reservations():
+            self._court_storage(recurring_reservation.court, create=True)
+            try:
+                self._validate_recurring_reservation(
+                    recurring_reservation, check_weekly_limit=False
+                )
+            except SlotUnavailable:
+                conflicts.append(recurring_reservation)
+            else:
+                self._add_recurring_reservation(recurring_reservation)
+        return conflicts
+
+    @instrumented
+    def import_reservations_from_file(
+        self,
+        name_of_file: str,
+        file_type: str,
+        merge: bool = False,
+        workers: Optional[int] = None,
+    ) -> "ImportReport":
+        from reservation_system.parallel_import import (
+            paused_garbage_collection,
+            read_reservations,
+        )
+
+        with paused_garbage_collection():
+            parsed_reservations = read_reservations(name_of_file, file_type, workers)
+            with self._schedule_lock.exclusive():
+                report = self._import_reservations(parsed_reservations, merge)
+        self._compact_journal_if_needed()
+        return report
+
+    def _import_reservations(
+        self, parsed_reservations: "ParsedReservations", merge: bool
+    ) -> "ImportReport":
+        from reservation_system.import_report import ImportReport
+
+        report = ImportReport(rejected=parsed_reservations.rejected)
+        accepted_reservations: list[Reservation] = []
+        last_court = None
+        last_accepted_end = datetime.min
+        for court, start_date, end_date, full_name in parsed_reservations.rows:
+            reservation = Reservation(
+                sys.intern(full_name), start_date, end_date, court
+            )
+            if court != last_court:
+                last_court = court
+                last_accepted_end = datetime.min
+            if start_date < last_accepted_end:
+                report.conflicts.append(reservation)
+                continue
+            if merge:
+                self._court_storage(court, create=True)
+                if self._first_overlapping(court, start_date, end_date) is not None:
+                    report.conflicts.append(reservation)
+                    continue
+            accepted_reservations.append(reservation)
+            last_accepted_end = end_date
+        if merge:
+            for reservation in accepted_reservations:
+                self._add_reservation(reservation)
         else:
-            raise ValueError(f"{file_type} is not supported.")
-        serializer.save_reservations(reservations_to_save)
+            self._replace_schedule(
+                self.create_court_storages(accepted_reservations), []
+            )
+        report.imported = len(accepted_reservations)
+        for recurring_reservation in parsed_reservations.recurring_reservations:
+            self._court_storage(recurring_reservation.court, create=True)
+            try:
+                self._validate_recurring_reservation(
+                    recurring_reservation, check_weekly_limit=False
+                )
+            except SlotUnavailable:
+                report.conflicts.append(recurring_reservation)
+            else:
+                self._add_recurring_reservation(recurring_reservation)
+                report.imported += 1
+        if not merge:
+            self._compact_journal()
+        if self.metrics.enabled:
+            self.metrics.add_items(len(parsed_reservations.rows))
+        return report
 
-    def load_reservations_from_file(self, name_of_file: str, file_type: str) -> None:
-        serializer: Serializer
+    def replace_reservations(
+        self,
+        reservations: Iterable[Reservation],
+        recurring_reservations: Iterable[RecurringReservation] = (),
+    ) -> None:
+        with self._schedule_lock.exclusive():
+            self._replace_schedule(
+                self.create_court_storages(reservations), list(recurring_reservations)
+            )
+            self._compact_journal()
+
+    def _replace_schedule(
+        self,
+        court_reservations: dict[int, ReservationStorage],
+        recurring_reservations: list[RecurringReservation],
+    ) -> None:
+        with self._state_lock:
+            self.court_reservations = {
+                court: self.create_storage(court=court) for court in self.courts
+            }
+            self.court_reservations.update(court_reservations)
+            self.courts = sorted(self.court_reservations)
+            self._user_reservations = None
+            self.recurring_reservations = recurring_reservations
+            self._reset_derived_state()
+
+    def open_journal(self, journal_file: str, snapshot_file: str) -> None:
+        with self._schedule_lock.exclusive():
+            if os.path.exists(snapshot_file):
+                self._load_reservations_from_file(
+                    snapshot_file, FileType.BINARY, merge=False
+                )
+            replayed_events = 0
+            for event, reservation in ReservationJournal.replay(journal_file):
+                replayed_events += 1
+                if isinstance(reservation, RecurringReservation):
+                    self._replay_recurring_event(event, reservation)
+                    continue
+                already_stored = reservation in self._court_storage(
+                    reservation.court, create=True
+                ).find_by_start_date(reservation.start_date)
+                if event == JournalEvent.MAKE and not already_stored:
+                    self._add_reservation(reservation)
+                elif event == JournalEvent.CANCEL and already_stored:
+                    self._remove_reservation(reservation)
+            self.journal = ReservationJournal(
+                journal_file, events_written=replayed_events
+            )
+            self.snapshot_file = snapshot_file
+        self._compact_journal_if_needed()
+
+    def _replay_recurring_event(
+        self, event: str, recurring_reservation: RecurringReservation
+    ) -> None:
+        self.recurring_reservations = [
+            stored_recurring_reservation
+            for stored_recurring_reservation in self.recurring_reservations
+            if stored_recurring_reservation.identity()
+            != recurring_reservation.identity()
+        ]
+        if event == JournalEvent.RECURRING:
+            self._court_storage(recurring_reservation.court, create=True)
+            self.recurring_reservations.append(recurring_reservation)
+        self._reset_derived_state()
+
+    def compact_journal(self) -> None:
+        with self._schedule_lock.exclusive():
+            self._compact_journal()
+
+    def _compact_journal(self) -> None:
+        if self.journal is None or self.snapshot_file is None:
+            return
+        temporary_snapshot_file = f"{self.snapshot_file}.tmp"
+        ReservationBinarySerializer(temporary_snapshot_file).save_reservations(
+            chain.from_iterable(self.court_reservations.values()),
+            self.recurring_reservations,
+        )
+        with open(temporary_snapshot_file, mode="rb") as snapshot:
+            os.fsync(snapshot.fileno())
+        os.replace(temporary_snapshot_file, self.snapshot_file)
+        self.journal.truncate()
+
+    def close(self) -> None:
+        with self._schedule_lock.exclusive():
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+
+    def _compact_journal_if_needed(self) -> None:
+        if (
+            self.journal is not None
+            and self.journal.events_written >= JOURNAL_COMPACT_EVERY
+        ):
+            with self._schedule_lock.exclusive():
+                if (
+                    self.journal is not None
+                    and self.journal.events_written >= JOURNAL_COMPACT_EVERY
+                ):
+                    self._compact_journal()
+
+    def create_storage(self, court: int = DEFAULT_COURT) -> ReservationStorage:
+        if self.columnar:
+            return ColumnarReservationStore(court=court)
+        return ReservationIndex()
+
+    def create_court_storages(
+        self, reservations: Iterable[Reservation]
+    ) -> dict[int, ReservationStorage]:
+        court_reservations: dict[int, ReservationStorage] = {}
+        for reservation in reservations:
+            storage = court_reservations.get(reservation.court)
+            if storage is None:
+                storage = self.create_storage(court=reservation.court)
+                court_reservations[reservation.court] = storage
+            storage.append(reservation)
+        for storage in court_reservations.values():
+            storage.sort()
+        return court_reservations
+
+    def _storages(self, court: Optional[int] = None) -> list[ReservationStorage]:
+        if court is None:
+            return list(self.court_reservations.values())
+        return [self._court_storage(court)]
+
+    def _court_storage(self, court: int, create: bool = False) -> ReservationStorage:
+        storage = self.court_reservations.get(court)
+        if storage is None:
+            if not create:
+                raise CourtNoExist()
+            storage = self.create_storage(court=court)
+            self.court_reservations[court] = storage
+            self.courts = sorted(self.court_reservations)
+        return storage
+
+    @staticmethod
+    def create_serializer(
+        name_of_file: str, file_type: str, compact: bool = False
+    ) -> Serializer:
         if file_type.upper() == FileType.JSON:
-            serializer = ReservationJSONSerializer(file_name=name_of_file)
+            from reservation_system.reservation_json_serializer import (
+                ReservationJSONSerializer,
+            )
+
+            return ReservationJSONSerializer(file_name=name_of_file, compact=compact)
         elif file_type.upper() == FileType.CSV:
-            serializer = ReservationCSVSerializer(file_name=name_of_file)
-        else:
-            raise ValueError(f"{file_type} is not supported.")
-        self.reservations = serializer.load_reservations()
+            from reservation_system.reservation_csv_serializer import (
+                ReservationCSVSerializer,
+            )
+
+            return ReservationCSVSerializer(file_name=name_of_file)
+        elif file_type.upper() == FileType.BINARY:
+            return ReservationBinarySerializer(file_name=name_of_file)
+        raise ValueError(f"{file_type} is not supported.")
@@ -0,0 +1,206 @@
+import argparse
+import asyncio
+import json
+from itertools import islice
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from reservation_system import errors
+from reservation_system.configuration import (
+    COLUMNAR_STORAGE,
+    DEFAULT_COURT,
+    JOURNAL_FILE,
+    SERVER_HOST,
+    SERVER_MAX_PIPELINED_REQUESTS,
+    SERVER_PORT,
+    SNAPSHOT_FILE,
+)
+from reservation_system.datetime_utils import format_datetime, parse_datetime
+from reservation_system.reservation import Reservation
+from reservation_system.reservation_manager import ReservationManager
+
+Params = dict[str, Any]
+Response = dict[str, Any]
+
+INTERNAL_ERROR = "InternalError"
+
+DOMAIN_ERRORS = (
+    errors.CourtIsClosed,
+    errors.CourtNoExist,
+    errors.LessThanHour,
+    errors.ReservationNoExist,
+    errors.SlotUnavailable,
+    errors.TooManyReservations,
+    errors.UnknownMethod,
+    errors.WrongDataFormat,
+    errors.WrongSessionDuration,
+)
+
+
+class ReservationServer:
+    def __init__(self, reservation_manager: ReservationManager) -> None:
+        self.reservation_manager = reservation_manager
+        self.methods: dict[str, Callable[[Params], Any]] = {
+            "make": self.make,
+            "cancel": self.cancel,
+            "schedule": self.schedule,
+            "nearest": self.nearest,
+        }
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        pending_responses: asyncio.Queue[Optional[Awaitable[Response]]] = asyncio.Queue(
+            maxsize=SERVER_MAX_PIPELINED_REQUESTS
+        )
+        response_writer = asyncio.create_task(
+            self.write_responses(pending_responses, writer)
+        )
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    await pending_responses.put(
+                        asyncio.create_task(self.handle_line(line))
+                    )
+            await pending_responses.put(None)
+            await response_writer
+        except ConnectionError:
+            pass
+        finally:
+            response_writer.cancel()
+            writer.close()
+
+    @staticmethod
+    async def write_responses(
+        pending_responses: "asyncio.Queue[Optional[Awaitable[Response]]]",
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        while (pending_response := await pending_responses.get()) is not None:
+            try:
+                response = await pending_response
+                line = json.dumps(response, ensure_ascii=False).encode() + b"\n"
+            except Exception:
+                continue
+            writer.write(line)
+            if pending_responses.empty():
+                await writer.drain()
+
+    async def handle_line(self, line: bytes) -> Response:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            method = self.methods.get(request.get("method"))
+            if method is None:
+                raise errors.UnknownMethod(f"Unknown method {request.get('method')}.")
+            result = await asyncio.to_thread(method, request.get("params", {}))
+            return {"id": request_id, "result": result}
+        except DOMAIN_ERRORS as error:
+            return self.error_response(request_id, type(error).__name__, error)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            return self.error_response(request_id, "WrongDataFormat", error)
+        except Exception as error:
+            return self.error_response(request_id, INTERNAL_ERROR, error)
+
+    @staticmethod
+    def error_response(request_id: Any, code: str, error: Exception) -> Response:
+        return {"id": request_id, "error": {"code": code, "message": str(error)}}
+
+    def make(self, params: Params) -> Params:
+        every_weeks = params.get("every_weeks")
+        until = params.get("until")
+        if every_weeks is None and until is None:
+            self.reservation_manager.make_a_reservation(
+                params["name"],
+                parse_datetime(params["start_time"]),
+                int(params["duration"]),
+                int(params.get("court", DEFAULT_COURT)),
+            )
+            return {}
+        self.reservation_manager.make_a_recurring_reservation(
+            params["name"],
+            parse_datetime(params["start_time"]),
+            int(params["duration"]),
+            int(params.get("court", DEFAULT_COURT)),
+            int(every_weeks or 1),
+            None if until is None else parse_datetime(until),
+        )
+        return {}
+
+    def cancel(self, params: Params) -> Params:
+        court = params.get("court")
+        cancel_reservation = (
+            self.reservation_manager.cancel_recurring_reservation
+            if params.get("series")
+            else self.reservation_manager.delete_a_reservation
+        )
+        cancel_reservation(
+            params["name"],
+            parse_datetime(params["start_time"]),
+            None if court is None else int(court),
+        )
+        return {}
+
+    def schedule(self, params: Params) -> list[Params]:
+        court = params.get("court")
+        reservations = self.reservation_manager.find_reservation_in_range(
+            parse_datetime(params["start_time"]),
+            parse_datetime(params["end_time"]),
+            None if court is None else int(court),
+        )
+        return [self.reservation_to_dict(reservation) for reservation in reservations]
+
+    def nearest(self, params: Params) -> list[Params]:
+        start_date = parse_datetime(params["start_time"])
+        duration = int(params["duration"])
+        count = int(params.get("count", 1))
+        horizon_days = params.get("horizon_days")
+        horizon = None if horizon_days is None else timedelta(days=horizon_days)
+        court = params.get("court")
+        if court is None:
+            court_slots = self.reservation_manager.iter_available_court_slots(
+                start_date, duration, horizon
+            )
+            return [
+                {"start_time": format_datetime(slot), "court": slot_court}
+                for slot, slot_court in islice(court_slots, count)
+            ]
+        slots = self.reservation_manager.find_available_slots(
+            start_date, duration, count, horizon, int(court)
+        )
+        return [{"start_time": format_datetime(slot), "court": court} for slot in slots]
+
+    @staticmethod
+    def reservation_to_dict(reservation: Reservation) -> Params:
+        return {
+            "name": reservation.full_name,
+            "start_time": format_datetime(reservation.start_date),
+            "end_time": format_datetime(reservation.end_date),
+            "court": reservation.court,
+        }
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Tennis court reservation server")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    arguments = parser.parse_args()
+    reservation_manager = ReservationManager(columnar=COLUMNAR_STORAGE)
+    reservation_manager.open_journal(JOURNAL_FILE, SNAPSHOT_FILE)
+    try:
+        asyncio.run(
+            ReservationServer(reservation_manager).serve(arguments.host, arguments.port)
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reservation_manager.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -1,11 +1,25 @@
-import calendar
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Sequence
 
-from reservation_system.reservation_manager import ReservationManager
+from reservation_system.reservation_manager import ReservationManager, ScheduleEntry
 from reservation_system.configuration import (
-    DATETIME_FORMAT,
     MAX_SESSION_DURATION,
     MIN_SESSION_DURATION,
     DATE_FORMAT,
+    NUMBER_OF_COURTS,
+    DEFAULT_COURT,
+    SCHEDULE_PAGE_SIZE,
+)
+from reservation_system.datetime_utils import parse_datetime
+from reservation_system.messages import (
+    CANCEL_LESS_THAN_HOUR_MESSAGE,
+    COURT_IS_CLOSED_MESSAGE,
+    LESS_THAN_HOUR_MESSAGE,
+    RESERVATION_NO_EXIST_MESSAGE,
+    SLOT_UNAVAILABLE_MESSAGE,
+    TOO_MANY_RESERVATIONS_MESSAGE,
 )
 from reservation_system.const import UserChoice, YesNoUserChoice
 from reservation_system.errors import (
@@ -14,9 +28,11 @@ from reservation_system.errors import (
     ReservationNoExist,
     CourtIsClosed,
     TooManyReservations,
+    WrongDataFormat,
 )
-from reservation_system.reservation import Reservation
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+DAY_HEADER_CACHE_SIZE = 1024
 
 
 class UserInterface:
@@ -33,6 +49,8 @@ class UserInterface:
             print("4) SAVE SCHEDULE TO FILE")
             print("5) EXIT")
             print("6) LOAD RESERVATIONS FROM FILE")
+            print("7) SHOW METRICS")
+            print("8) SHOW MY RESERVATIONS")
             user_choice = input("What do you want to do: ")
             if user_choice.upper() in UserChoice.EXIT:
                 print("Thank you for your attention! Have a nice day!")
@@ -50,6 +68,10 @@ class UserInterface:
             return self.save_schedule_to_file()
         elif user_choice.upper() in UserChoice.LOAD_RESERVATIONS_FROM_FILE:
             return self.load_reservation_from_file()
+        elif user_choice.upper() in UserChoice.SHOW_METRICS:
+            return self.show_metrics()
+        elif user_choice.upper() in UserChoice.SHOW_MY_RESERVATIONS:
+            return self.show_my_reservations()
         else:
             print(f"Unknown command {user_choice}. Try again")
 
@@ -70,23 +92,20 @@ class UserInterface:
                 print("There is no available slot for reservation today.")
                 continue
             duration_time = self.load_duration_from_user(duration_slots)
+            court = self.load_court_from_user()
             try:
                 self.reservation_manager.make_a_reservation(
-                    name, date_from_user, duration_time
+                    name, date_from_user, duration_time, court
                 )
                 print(f"Your reservation has been done and added to schedule.")
                 return
             except CourtIsClosed:
-                print("Sorry Court is open from 8:00 to 18:00.")
+                print(COURT_IS_CLOSED_MESSAGE)
             except LessThanHour:
-                print(
-                    "Sorry, you cannot make a reservation if there is less than an hour left before it starts."
-                )
+                print(LESS_THAN_HOUR_MESSAGE)
                 return
             except TooManyReservations:
-                print(
-                    "Sorry, you cannot make a reservation because you have 2 active reservations per week."
-                )
+                print(TOO_MANY_RESERVATIONS_MESSAGE)
                 return
             except SlotUnavailable:
                 continue_search = self.search_for_alternative_slot(
@@ -96,30 +115,41 @@ class UserInterface:
     def search_for_alternative_slot(
         self, name: str, date_from_user: datetime, duration_time: int
     ) -> bool:
-        possible_reservation = self.reservation_manager.find_nearest_available_slot(
-            date_from_user, duration_time
-        )
-        while True:
-            proposal_next_available_date = input(
-                f"The time you chose is unavailable, would you like to make a "
-                f"reservation for {possible_reservation} instead? YES/NO: "
+        try:
+            possible_reservation, court = (
+                self.reservation_manager.find_earliest_available_court(
+                    date_from_user, duration_time, full_name=name
+                )
             )
-            if proposal_next_available_date in [
-                YesNoUserChoice.YES,
-                YesNoUserChoice.NO,
-            ]:
-                break
-            print("Wrong answer, Please make sure you entered YES or NO: ")
+        except SlotUnavailable:
+            print(
+                "Sorry, there is no available slot for you in the coming weeks. "
+                "Please choose another date."
+            )
+            return True
+        court_description = f" on court {court}" if self.shows_courts() else ""
+        proposal_next_available_date = self.load_yes_no_from_user(
+            f"The time you chose is unavailable, would you like to make a "
+            f"reservation for {possible_reservation}{court_description} instead? "
+            f"YES/NO: "
+        )
         if proposal_next_available_date == YesNoUserChoice.NO:
             return True
         try:
             self.reservation_manager.make_a_reservation(
-                name, possible_reservation, duration_time
+                name, possible_reservation, duration_time, court
             )
             print(f"Your reservation has been done and added to schedule.")
             return True
+        except CourtIsClosed:
+            print(COURT_IS_CLOSED_MESSAGE)
+            return True
+        except LessThanHour:
+            print(LESS_THAN_HOUR_MESSAGE)
+        except TooManyReservations:
+            print(TOO_MANY_RESERVATIONS_MESSAGE)
         except SlotUnavailable:
-            print("Sorry but this time is not available.")
+            print(SLOT_UNAVAILABLE_MESSAGE)
         return False
 
     def cancel_reservation(self) -> None:
@@ -131,28 +161,41 @@ class UserInterface:
                 print("Your reservation has been deleted.")
                 return
             except ReservationNoExist:
-                print("Sorry but this reservation is not exists.")
+                print(RESERVATION_NO_EXIST_MESSAGE)
                 return
             except LessThanHour:
-                print(
-                    "Sorry, you cannot cancel a reservation if there is less than an hour left before it starts."
-                )
+                print(CANCEL_LESS_THAN_HOUR_MESSAGE)
                 return
 
     def print_schedule(self) -> None:
         print("Time range you want to see")
         start_date = self.load_date_from_user("From date")
         end_date = self.load_date_from_user("To date")
-        schedule = self.reservation_manager.find_reservation_in_range(
+        schedule = self.reservation_manager.iter_reservation_in_range(
             start_date, end_date
         )
-        self.show_user_reservations(schedule)
+        self.show_schedule_pages(schedule)
+
+    def show_schedule_pages(self, schedule: Iterable[ScheduleEntry]) -> None:
+        schedule_text = self.iter_schedule_text(
+            schedule, SCHEDULE_PAGE_SIZE, self.shows_courts()
+        )
+        page = list(islice(schedule_text, SCHEDULE_PAGE_SIZE))
+        while page:
+            sys.stdout.write("".join(page))
+            sys.stdout.flush()
+            page = list(islice(schedule_text, SCHEDULE_PAGE_SIZE))
+            if page and (
+                self.load_yes_no_from_user("\nShow the next page? YES/NO: ")
+                == YesNoUserChoice.NO
+            ):
+                return
 
     def save_schedule_to_file(self) -> None:
         start_date = self.load_date_from_user("From date")
         end_date = self.load_date_from_user("To date")
         name_of_file = input(f"Enter the name of save file: ")
-        type_of_file = input(f"Choose a file format: JSON or CSV: ")
+        type_of_file = input(f"Choose a file format: JSON, CSV or BIN: ")
         try:
             self.reservation_manager.save_reservations_from_range(
                 start_date, end_date, name_of_file, type_of_file
@@ -164,30 +207,113 @@ class UserInterface:
 
     def load_reservation_from_file(self) -> None:
         name_of_file = input(f"Enter the name of file: ")
-        type_of_file = input(f"Choose a file format: JSON or CSV: ")
+        type_of_file = input(f"Choose a file format: JSON, CSV or BIN: ")
+        merge = self.load_yes_no_from_user(
+            "Would you like to merge them with the current schedule? YES/NO: "
+        )
         try:
-            self.reservation_manager.load_reservations_from_file(
-                name_of_file, type_of_file
+            report = self.reservation_manager.import_reservations_from_file(
+                name_of_file, type_of_file, merge == YesNoUserChoice.YES
             )
         except ValueError as error:
             print(error)
         except FileNotFoundError:
             print(f"The file {name_of_file} does not exist")
+        except WrongDataFormat as error:
+            print(error)
         else:
-            print(f"Reservations have been loaded from {name_of_file} file")
+            print(
+                f"{report.imported} reservations have been loaded from "
+                f"{name_of_file} file"
+            )
+            if report.conflicts:
+                print(
+                    f"{len(report.conflicts)} reservations were skipped because "
+                    f"the court is already reserved at that time:"
+                )
+                self.show_user_reservations(report.conflicts)
+            if report.rejected:
+                print(f"{len(report.rejected)} rows were rejected:")
+                for rejected_row in report.rejected[:SCHEDULE_PAGE_SIZE]:
+                    print(rejected_row)
+                if len(report.rejected) > SCHEDULE_PAGE_SIZE:
+                    print(f"... and {len(report.rejected) - SCHEDULE_PAGE_SIZE} more")
+
+    def show_my_reservations(self) -> None:
+        name = input("Please enter your full name: ")
+        reservations = self.reservation_manager.find_upcoming_reservations(name)
+        if not reservations:
+            print("You have no upcoming reservations.")
+            return
+        print("Your upcoming reservations:")
+        self.show_user_reservations(reservations)
+
+    def show_metrics(self) -> None:
+        metrics = self.reservation_manager.metrics
+        if not metrics.enabled:
+            enable = self.load_yes_no_from_user(
+                "Metrics are disabled. Would you like to enable them? YES/NO: "
+            )
+            if enable == YesNoUserChoice.YES:
+                self.reservation_manager.enable_metrics()
+                print("Metrics are now being recorded.")
+            return
+        print(metrics.to_text())
+        save = self.load_yes_no_from_user(
+            "Would you like to save the metrics to a JSON file? YES/NO: "
+        )
+        if save == YesNoUserChoice.YES:
+            name_of_file = input(f"Enter the name of save file: ")
+            try:
+                with open(name_of_file, mode="w", encoding="utf8") as metrics_file:
+                    metrics_file.write(metrics.to_json())
+            except OSError as error:
+                print(error)
+            else:
+                print(f"The metrics have been saved to {name_of_file} file")
+
+    @staticmethod
+    def load_yes_no_from_user(message: str) -> str:
+        while True:
+            answer = input(message)
+            if answer in [YesNoUserChoice.YES, YesNoUserChoice.NO]:
+                return answer
+            print("Wrong answer, Please make sure you entered YES or NO: ")
 
     @staticmethod
     def load_date_from_user(message: str) -> datetime:
         while True:
             date_input = input(f"{message} DD.MM.YYYY HH:MM ")
             try:
-                correct_date = datetime.strptime(date_input, DATETIME_FORMAT)
+                correct_date = parse_datetime(date_input)
                 return correct_date
             except ValueError:
                 print(
                     "Wrong data format. Please make sure you entered correctly. Example: 07.03.2023 10:00 "
                 )
 
+    def shows_courts(self) -> bool:
+        return len(self.reservation_manager.courts) > 1
+
+    def load_court_from_user(self) -> int:
+        courts = self.reservation_manager.courts
+        if not courts:
+            return DEFAULT_COURT
+        if len(courts) == 1:
+            return courts[0]
+        while True:
+            court_from_user = input(
+                f"Which court would you like to book? "
+                f"{', '.join(map(str, courts))}: "
+            )
+            try:
+                court = int(court_from_user)
+            except ValueError:
+                court = 0
+            if court in courts:
+                return court
+            print("Wrong choice. Please make sure you entered correctly option.")
+
     @staticmethod
     def load_duration_from_user(duration_slots: list[int]) -> int:
         while True:
@@ -219,22 +345,44 @@ class UserInterface:
             for index in range(1, number_of_small_slots + 1)
         ]
 
-    @staticmethod
-    def show_user_reservations(reservations: list[Reservation]) -> None:
-        reservations.sort(key=lambda r: r.start_date)
+    def show_user_reservations(self, reservations: Sequence[ScheduleEntry]) -> None:
+        sys.stdout.write(
+            "".join(
+                self.iter_schedule_text(
+                    sorted(reservations, key=lambda r: r.start_date),
+                    show_court=self.shows_courts(),
+                )
+            )
+        )
+
+    @classmethod
+    def iter_schedule_text(
+        cls,
+        reservations: Iterable[ScheduleEntry],
+        page_size: Optional[int] = None,
+        show_court: bool = NUMBER_OF_COURTS > 1,
+    ) -> Iterator[str]:
         headers_day = None
-        present_day = datetime.today()
-        for reservation in reservations:
-            if reservation.start_date.date() != headers_day:
+        present_day = datetime.today().date()
+        for position, reservation in enumerate(reservations):
+            if reservation.start_date.date() != headers_day or (
+                page_size is not None and position % page_size == 0
+            ):
                 headers_day = reservation.start_date.date()
-                if headers_day == present_day.date() - timedelta(days=1):
-                    print("\nYesterday:")
-                elif headers_day == present_day.date():
-                    print("\nToday:")
-                elif headers_day == present_day.date() + timedelta(days=1):
-                    print("\nTomorrow:")
-                else:
-                    print(
-                        f"\n{calendar.day_name[headers_day.weekday()]} {headers_day.strftime(DATE_FORMAT)}:"
-                    )
-            print(reservation)
+                yield (
+                    f"{cls.day_header(headers_day, present_day)}"
+                    f"{reservation.describe(show_court)}\n"
+                )
+            else:
+                yield f"{reservation.describe(show_court)}\n"
+
+    @staticmethod
+    @lru_cache(maxsize=DAY_HEADER_CACHE_SIZE)
+    def day_header(headers_day: date, present_day: date) -> str:
+        if headers_day == present_day - timedelta(days=1):
+            return "\nYesterday:\n"
+        elif headers_day == present_day:
+            return "\nToday:\n"
+        elif headers_day == present_day + timedelta(days=1):
+            return "\nTomorrow:\n"
+        return f"\n{headers_day.strftime(f'%A {DATE_FORMAT}')}:\n"
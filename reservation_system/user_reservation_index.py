@@ -0,0 +1,86 @@
+import sys
+from array import array
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+from reservation_system.datetime_utils import (
+    from_epoch_minutes,
+    to_epoch_minutes,
+    to_epoch_minutes_rounded_up,
+)
+from reservation_system.reservation import Reservation
+
+COURT_BITS = 32
+COURT_MASK = (1 << COURT_BITS) - 1
+
+
+class UserReservationIndex:
+    def __init__(self, entries: Iterable[tuple[str, int, int]] = ()) -> None:
+        grouped_keys: dict[str, list[int]] = {}
+        for full_name, start_minute, court in entries:
+            user_keys = grouped_keys.get(full_name)
+            if user_keys is None:
+                user_keys = grouped_keys[sys.intern(full_name)] = []
+            user_keys.append(start_minute << COURT_BITS | court)
+        self._user_keys = {
+            full_name: array("q", sorted(user_keys))
+            for full_name, user_keys in grouped_keys.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(user_keys) for user_keys in self._user_keys.values())
+
+    def users(self) -> Iterator[str]:
+        return iter(self._user_keys)
+
+    def add(self, reservation: Reservation) -> None:
+        user_keys = self._user_keys.get(reservation.full_name)
+        if user_keys is None:
+            user_keys = self._user_keys[sys.intern(reservation.full_name)] = array("q")
+        insort(user_keys, self._key(reservation))
+
+    def remove(self, reservation: Reservation) -> None:
+        user_keys = self._user_keys.get(reservation.full_name, array("q"))
+        key = self._key(reservation)
+        position = bisect_left(user_keys, key)
+        if position == len(user_keys) or user_keys[position] != key:
+            raise ValueError("Reservation is not in the index.")
+        del user_keys[position]
+        if not user_keys:
+            del self._user_keys[reservation.full_name]
+
+    def courts_at(
+        self, full_name: str, start_date: datetime, court: Optional[int] = None
+    ) -> list[int]:
+        user_keys = self._user_keys.get(full_name)
+        if user_keys is None:
+            return []
+        start_minute = to_epoch_minutes(start_date)
+        first = bisect_left(user_keys, start_minute << COURT_BITS)
+        last = bisect_left(user_keys, (start_minute + 1) << COURT_BITS, lo=first)
+        return [
+            user_keys[position] & COURT_MASK
+            for position in range(first, last)
+            if court is None or user_keys[position] & COURT_MASK == court
+        ]
+
+    def starting_from(
+        self, full_name: str, start_date: datetime, limit: int
+    ) -> list[tuple[datetime, int]]:
+        user_keys = self._user_keys.get(full_name)
+        if user_keys is None:
+            return []
+        first = bisect_left(
+            user_keys, to_epoch_minutes_rounded_up(start_date) << COURT_BITS
+        )
+        return [
+            (from_epoch_minutes(key >> COURT_BITS), key & COURT_MASK)
+            for key in user_keys[first : first + limit]
+        ]
+
+    @staticmethod
+    def _key(reservation: Reservation) -> int:
+        return (
+            to_epoch_minutes(reservation.start_date) << COURT_BITS | reservation.court
+        )